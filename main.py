@@ -2,13 +2,17 @@ import pygame
 import sys
 from src.constants import *
 from src.game import Game
+from src.display import Display
+from src.audio_bundle import pre_init_mixer
 
 def main():
+    # Before pygame.init(), which opens the mixer
+    pre_init_mixer(AUDIO_BUNDLE_PATH)
     pygame.init()
-    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    display = Display.create(RENDER_SCALE, FULLSCREEN)
     pygame.display.set_caption("Șantierul Cuvintelor")
     
-    game = Game(screen)
+    game = Game(display.canvas, display=display)
     game.run()
     
     pygame.quit()
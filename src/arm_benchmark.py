@@ -0,0 +1,118 @@
+import os
+import sys
+import math
+import json
+import time
+import random
+import argparse
+import pygame
+from src.constants import *
+from src.metrics import Histogram
+from src.sprites import RoboticArm
+from src.arm_controller import ArmController, np
+
+DEFAULT_COUNTS = [1, 2, 4, 8, 16, 32, 64, 128, 256, 512]
+
+def arm_bases(count):
+    """Shoulders spread along the bottom of the screen"""
+    step = (SCREEN_WIDTH - 100) / max(1, count - 1)
+    return [(50 + i * step, ARM_BASE_Y) for i in range(count)]
+
+def random_target(rng):
+    return (rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT - 100))
+
+def step_towards(pos, target, max_step):
+    """Straight-line claw motion, as ArmController.update() does it"""
+    dx = target[0] - pos[0]
+    dy = target[1] - pos[1]
+    distance = math.hypot(dx, dy)
+    if distance <= max_step:
+        return target
+    ratio = max_step / distance
+    return (pos[0] + dx * ratio, pos[1] + dy * ratio)
+
+def bench_scalar(count, frames, seed, surface=None, alpha=1.0):
+    """Frame times (ms) of count RoboticArm objects solved one by one with solve_ik()"""
+    rng = random.Random(seed)
+    arms = [RoboticArm(x, y) for x, y in arm_bases(count)]
+    for arm in arms:
+        arm.target_pos = random_target(rng)
+    dt = 1.0 / SIM_RATE
+    times = Histogram(window=None)
+    for _ in range(frames):
+        start = time.perf_counter()
+        for arm in arms:
+            if arm.is_at_target():
+                arm.target_pos = random_target(rng)
+            arm.prev_pos = arm.current_pos
+            arm.prev_angles = (arm.angle1, arm.angle2)
+            arm.current_pos = step_towards(arm.current_pos, arm.target_pos, arm.speed * dt)
+            arm.solve_ik(*arm.current_pos)
+        if surface is not None:
+            for arm in arms:
+                arm.draw(surface, alpha)
+        times.add((time.perf_counter() - start) * 1000)
+    return times
+
+def bench_vectorized(count, frames, seed, surface=None, alpha=1.0):
+    """Frame times (ms) of count arms in one ArmController"""
+    rng = random.Random(seed)
+    controller = ArmController(arm_bases(count))
+    for index in range(count):
+        controller.set_target(index, random_target(rng))
+    dt = 1.0 / SIM_RATE
+    times = Histogram(window=None)
+    for _ in range(frames):
+        start = time.perf_counter()
+        for index in np.flatnonzero(controller.at_target()):
+            controller.set_target(index, random_target(rng))
+        controller.update(dt)
+        if surface is not None:
+            controller.draw(surface, alpha)
+        times.add((time.perf_counter() - start) * 1000)
+    return times
+
+def main(argv=None):
+    """Per-frame arm cost against arm count: python -m src.arm_benchmark"""
+    parser = argparse.ArgumentParser(description="Compare per-arm RoboticArm updates with the vectorized ArmController")
+    parser.add_argument("--arms", default=",".join(map(str, DEFAULT_COUNTS)), help="comma separated arm counts")
+    parser.add_argument("--frames", type=int, default=600, help="simulated frames per run (default: 600)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--draw", action="store_true", help="also draw the arms to an off-screen surface")
+    parser.add_argument("--alpha", type=float, default=1.0,
+                        help="with --draw, draw this far between updates (e.g. 0.5) to include render interpolation")
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args(argv)
+
+    if np is None:
+        print("numpy is not installed, only the per-arm version can be measured")
+
+    surface = None
+    if args.draw:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.init()
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    results = []
+    print(f"{'arms':>6}{'scalar mean':>13}{'p99':>8}{'numpy mean':>12}{'p99':>8}{'speedup':>9}   (ms per frame)")
+    for count in [int(n) for n in args.arms.split(",")]:
+        scalar = bench_scalar(count, args.frames, args.seed, surface, args.alpha).to_dict()
+        row = {"arms": count, "scalar": scalar}
+        line = f"{count:>6}{scalar['mean']:>13.3f}{scalar['p99']:>8.3f}"
+        if np is not None:
+            vectorized = bench_vectorized(count, args.frames, args.seed, surface, args.alpha).to_dict()
+            row["vectorized"] = vectorized
+            speedup = scalar["mean"] / vectorized["mean"] if vectorized["mean"] else 0.0
+            line += f"{vectorized['mean']:>12.3f}{vectorized['p99']:>8.3f}{speedup:>8.1f}x"
+        results.append(row)
+        print(line)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"frames": args.frames, "draw": args.draw, "alpha": args.alpha, "results": results}, f, indent=2)
+    if surface is not None:
+        pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+import pygame
+from src.constants import *
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class ArmController:
+    """
+    Several two-segment arms (cranes) moved and solved together
+
+    Joint state for all N arms lives in NumPy arrays of shape (N, 2), and each update()
+    moves every claw and runs inverse and forward kinematics for all arms in one
+    vectorized pass. Elbow and claw positions are kept for drawing, and the previous
+    angles for drawing between updates. IK and FK are the
+    same as RoboticArm's; claws move in straight lines at constant speed.
+    """
+
+    def __init__(self, bases, l1=SEGMENT_LENGTH, l2=SEGMENT_LENGTH, speed=ARM_SPEED):
+        """
+        Args:
+            bases: (x, y) shoulder position of every arm
+            l1, l2: Upper and lower segment lengths, shared by all arms
+            speed: Claw speed in pixels per second
+        """
+        if np is None:
+            raise ImportError("ArmController needs numpy (pip install numpy)")
+        self.base = np.array(bases, dtype=float).reshape(-1, 2)
+        self.count = len(self.base)
+        self.l1 = float(l1)
+        self.l2 = float(l2)
+        self.speed = float(speed)
+
+        self.rest = self.base + (100.0, -100.0)
+        self.current = self.rest.copy()
+        self.target = self.rest.copy()
+        self.angles = np.zeros((self.count, 2)) # shoulder, elbow
+        self.held_wagons = [None] * self.count
+        self.solve()
+        self.prev_angles = self.angles # Angles before the last update, for render interpolation
+
+    def __len__(self):
+        return self.count
+
+    def set_target(self, index, pos):
+        self.target[index] = pos
+
+    def move_to_rest(self, index=None):
+        if index is None:
+            self.target[:] = self.rest
+        else:
+            self.target[index] = self.rest[index]
+
+    def at_target(self):
+        """Boolean array, True for every arm whose claw has reached its target"""
+        return np.hypot(*(self.target - self.current).T) < 1
+
+    def compute_angles(self, points):
+        """Shoulder and elbow angles, shape (N, 2), that put each claw at points (N, 2)"""
+        delta = points - self.base
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+
+        # Out of reach: aim at the nearest reachable point in the same direction
+        reach = self.l1 + self.l2
+        too_far = dist > reach
+        if too_far.any():
+            delta[too_far] *= (reach / dist[too_far])[:, None]
+            dist = np.minimum(dist, reach)
+
+        # Law of cosines for the elbow, clamped for floating point errors
+        cos_elbow = (dist * dist - self.l1 * self.l1 - self.l2 * self.l2) / (2 * self.l1 * self.l2)
+        elbow = np.arccos(np.clip(cos_elbow, -1.0, 1.0))
+        phi = np.arctan2(delta[:, 1], delta[:, 0])
+        psi = np.arctan2(self.l2 * np.sin(elbow), self.l1 + self.l2 * np.cos(elbow))
+        return np.stack((phi - psi, elbow), axis=1)
+
+    def joint_positions(self, angles):
+        """Elbow and claw positions, each (N, 2), for the given angles"""
+        shoulder = angles[:, 0]
+        total = shoulder + angles[:, 1]
+        elbows = self.base + self.l1 * np.stack((np.cos(shoulder), np.sin(shoulder)), axis=1)
+        claws = elbows + self.l2 * np.stack((np.cos(total), np.sin(total)), axis=1)
+        return elbows, claws
+
+    def solve(self):
+        """IK for the current claw positions, then FK once for drawing and held wagons"""
+        self.angles = self.compute_angles(self.current)
+        self.elbows, self.claws = self.joint_positions(self.angles)
+
+    def update(self, dt):
+        """Move every claw towards its target by dt seconds and solve all arms"""
+        self.prev_angles = self.angles
+        delta = self.target - self.current
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+        max_step = self.speed * dt
+        moving = dist > max_step
+        ratio = np.divide(max_step, dist, out=np.zeros_like(dist), where=moving)
+        self.current = np.where(moving[:, None], self.current + delta * ratio[:, None], self.target)
+        self.solve()
+
+        for index, wagon in enumerate(self.held_wagons):
+            if wagon is not None:
+                x, y = self.claws[index]
+                wagon.rect.center = (int(x), int(y))
+
+    def render_joints(self, alpha=1.0):
+        """Elbow and claw positions to draw, alpha of the way from the previous update"""
+        if alpha >= 1.0:
+            return self.elbows, self.claws
+        # Angles are blended the shortest way round, as in RoboticArm.get_render_angles(),
+        # so drawing between updates costs one FK pass and no IK
+        delta = (self.angles - self.prev_angles + np.pi) % (2 * np.pi) - np.pi
+        return self.joint_positions(self.prev_angles + delta * alpha)
+
+    def draw(self, surface, alpha=1.0):
+        elbows, claws = self.render_joints(alpha)
+        bases = self.base.tolist()
+        for base, elbow, claw, wagon in zip(bases, elbows.tolist(), claws.tolist(), self.held_wagons):
+            pygame.draw.line(surface, ARM_COLOR, base, elbow, 20)
+            pygame.draw.line(surface, ARM_COLOR, elbow, claw, 15)
+            pygame.draw.circle(surface, JOINT_COLOR, base, 15)
+            pygame.draw.circle(surface, JOINT_COLOR, (int(elbow[0]), int(elbow[1])), 12)
+            pygame.draw.circle(surface, CLAW_COLOR, (int(claw[0]), int(claw[1])), 12 if wagon else 10)
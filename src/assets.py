@@ -0,0 +1,152 @@
+import os
+import hashlib
+import tempfile
+import pygame
+
+class AssetManager:
+    """
+    Lazily loaded, display-format images with an on-disk cache of scaled variants.
+
+    Scaled images are saved as PNG in the temp directory under a name that includes the
+    source file's mtime, so editing an asset invalidates its cached variants automatically;
+    the outdated files are deleted when the new variant is written. Loading a cached
+    variant is cheaper than decoding a large source and scaling it again.
+    """
+
+    def __init__(self, root="assets/images", cache_dir=None):
+        self.root = root
+        self.cache_dir = cache_dir or os.path.join(tempfile.gettempdir(), "santier_cuvinte_assets")
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+        self.registry = {} # key -> (relative path, has alpha)
+        self._images = {} # (key, size, smooth) -> Surface
+
+    def register(self, key, filename, alpha=True):
+        """Make an image available under key. Nothing is loaded until get() is called."""
+        self.registry[key] = (filename, alpha)
+
+    def register_letters(self, folder="litere IOC"):
+        """Register every letter image in folder as 'letter_<X>'"""
+        path = os.path.join(self.root, folder)
+        if not os.path.isdir(path):
+            return []
+        letters = []
+        for filename in sorted(os.listdir(path)):
+            letter, ext = os.path.splitext(filename)
+            if ext.lower() == ".png":
+                self.register(f"letter_{letter}", os.path.join(folder, filename))
+                letters.append(letter)
+        return letters
+
+    def source_path(self, key):
+        return os.path.join(self.root, self.registry[key][0])
+
+    @staticmethod
+    def _convert(surface, alpha):
+        """Match the display's pixel format so blits don't convert every frame"""
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    def _cache_path(self, key, size, mtime_ns):
+        """<variant>.<mtime>.png, so the files of older versions of a variant can be found"""
+        variant = hashlib.md5(f"{key}|{size[0]}x{size[1]}".encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{variant}.{mtime_ns}.png")
+
+    def _prune(self, cache_path):
+        """Delete the files of the same variant made from older versions of the source"""
+        current = os.path.basename(cache_path)
+        prefix = current.split(".", 1)[0] + "."
+        for name in os.listdir(self.cache_dir):
+            # Temp files may still be written by another process
+            if name.startswith(prefix) and name != current and ".tmp." not in name:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _save_png(surface, path):
+        """Write the PNG under a temp name and rename it, so a crash never leaves half a file"""
+        tmp_path = path + ".tmp.png"
+        try:
+            pygame.image.save(surface, tmp_path)
+            os.replace(tmp_path, path)
+        except (pygame.error, OSError) as e:
+            print(f"Failed to cache image {path}: {e}")
+
+    def get(self, key, size=None, smooth=True):
+        """
+        Image for key, optionally scaled to size, converted to the display format
+
+        Args:
+            smooth: Scale with smoothscale (default) or with the faster, blockier scale
+
+        Raises:
+            KeyError if key was never registered, pygame.error/OSError if the file can't be loaded
+        """
+        size = tuple(size) if size else None
+        cached = self._images.get((key, size, smooth))
+        if cached is not None:
+            return cached
+
+        alpha = self.registry[key][1]
+        source = self.source_path(key)
+        if size is None:
+            image = pygame.image.load(source)
+        else:
+            variant = key if smooth else f"{key}|nearest"
+            cache_path = self._cache_path(variant, size, os.stat(source).st_mtime_ns)
+            if os.path.exists(cache_path):
+                image = pygame.image.load(cache_path)
+            else:
+                image = self._convert(pygame.image.load(source), True)
+                image = pygame.transform.smoothscale(image, size) if smooth else pygame.transform.scale(image, size)
+                self._save_png(image, cache_path)
+                self._prune(cache_path)
+
+        image = self._convert(image, alpha)
+        self._images[(key, size, smooth)] = image
+        return image
+
+    def letter_atlas(self, cell_size, letters=None):
+        """
+        Pack letter images into one texture, each scaled to fit cell_size keeping its aspect
+
+        Returns:
+            (atlas surface, {letter: Rect inside the atlas}). Use atlas.subsurface(rect)
+            to get one letter without copying pixels.
+        """
+        if letters is None:
+            letters = [key[len("letter_"):] for key in self.registry if key.startswith("letter_")]
+        letters = sorted(letters)
+        if not letters:
+            return None, {}
+
+        cell_w, cell_h = cell_size
+        columns = max(1, int(len(letters) ** 0.5 + 0.999))
+        rows = (len(letters) + columns - 1) // columns
+        rects = {letter: pygame.Rect((i % columns) * cell_w, (i // columns) * cell_h, cell_w, cell_h)
+                 for i, letter in enumerate(letters)}
+
+        # The atlas is invalidated when any letter image changes
+        mtimes = [os.stat(self.source_path(f"letter_{letter}")).st_mtime_ns for letter in letters]
+        atlas_key = "atlas|" + "|".join(letters)
+        cache_path = self._cache_path(atlas_key, cell_size, max(mtimes))
+
+        # Cell layout only depends on the sorted letters, so only the pixels are cached
+        if os.path.exists(cache_path):
+            atlas = pygame.image.load(cache_path)
+        else:
+            atlas = pygame.Surface((columns * cell_w, rows * cell_h), pygame.SRCALPHA)
+            for letter, cell in rects.items():
+                image = pygame.image.load(self.source_path(f"letter_{letter}"))
+                scale = min(cell_w / image.get_width(), cell_h / image.get_height())
+                scaled = pygame.transform.smoothscale(
+                    self._convert(image, True),
+                    (max(1, int(image.get_width() * scale)), max(1, int(image.get_height() * scale))))
+                atlas.blit(scaled, scaled.get_rect(center=cell.center))
+            self._save_png(atlas, cache_path)
+            self._prune(cache_path)
+
+        return self._convert(atlas, True), rects
@@ -0,0 +1,130 @@
+import os
+import json
+import mmap
+import struct
+import pygame
+from src.constants import MIXER_FORMAT
+
+# File layout: MAGIC, u32 index length, JSON index, then raw PCM clips back to back.
+# The index maps text -> [offset, length] relative to the start of the PCM data and records
+# the mixer format the samples were decoded for.
+MAGIC = b"SCAUDIO1"
+HEADER = struct.Struct("<8sI")
+
+def write_bundle(path, clips, mixer_format):
+    """
+    Pack pre-decoded clips into one bundle file
+
+    Args:
+        path: Output file
+        clips: dict of text -> raw PCM bytes (as returned by Sound.get_raw())
+        mixer_format: pygame.mixer.get_init() tuple the samples match
+    """
+    index = {"mixer": list(mixer_format), "clips": {}}
+    offset = 0
+    for text, raw in clips.items():
+        index["clips"][text] = [offset, len(raw)]
+        offset += len(raw)
+    index_blob = json.dumps(index, ensure_ascii=False).encode('utf-8')
+
+    folder = os.path.dirname(path)
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(index_blob)))
+        f.write(index_blob)
+        for raw in clips.values():
+            f.write(raw)
+    os.replace(tmp_path, path)
+
+def read_mixer_format(path):
+    """Mixer format a bundle's samples were decoded for, or None if path is not a readable bundle"""
+    try:
+        with open(path, 'rb') as f:
+            magic, index_len = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC:
+                return None
+            index = json.loads(f.read(index_len).decode('utf-8'))
+        return tuple(index["mixer"])
+    except (OSError, ValueError, KeyError, struct.error):
+        return None
+
+def pre_init_mixer(bundle_path=None):
+    """
+    Pin the mixer format before pygame.init() or pygame.mixer.init()
+
+    Left alone, SDL may pick another frequency or channel count for each audio device,
+    and a bundle decoded for a different format is ignored. The format stored in the
+    bundle is used if there is one, MIXER_FORMAT otherwise; SDL converts to the device.
+    """
+    mixer_format = (read_mixer_format(bundle_path) if bundle_path else None) or MIXER_FORMAT
+    frequency, size, channels = mixer_format
+    pygame.mixer.pre_init(frequency, size, channels, allowedchanges=0)
+
+class AudioBundle:
+    """Read-only, memory-mapped bundle of pre-decoded speech clips"""
+
+    def __init__(self, path):
+        self.path = path
+        self.clips = {}
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, index_len = HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC:
+                raise ValueError("not an audio bundle")
+            index = json.loads(self._map[HEADER.size:HEADER.size + index_len].decode('utf-8'))
+        except Exception:
+            self._file.close()
+            raise
+        self.mixer_format = tuple(index["mixer"])
+        self.clips = index["clips"]
+        self._data_start = HEADER.size + index_len
+        self._view = memoryview(self._map)
+
+    def __contains__(self, text):
+        return text in self.clips
+
+    def __len__(self):
+        return len(self.clips)
+
+    def matches_mixer(self):
+        """Samples can only be used if the mixer runs with the format they were decoded for"""
+        return pygame.mixer.get_init() == self.mixer_format
+
+    def get_sound(self, text):
+        """Build a Sound from the clip's slice of the mapped file, or None if it is not bundled"""
+        entry = self.clips.get(text)
+        if entry is None:
+            return None
+        offset, length = entry
+        start = self._data_start + offset
+        return pygame.mixer.Sound(buffer=self._view[start:start + length])
+
+    def close(self):
+        try:
+            self._view.release()
+            self._map.close()
+        except BufferError:
+            # A slice is still referenced somewhere, the map is freed with it
+            pass
+        self._file.close()
+
+def main():
+    """Build the speech bundle for every phrase the game uses: python -m src.audio_bundle"""
+    from src.constants import AUDIO_BUNDLE_PATH, TTS_BACKEND, TTS_PRELOAD_WORKERS
+    from src.game import get_speech_texts
+    from src.tts import TTSManager
+
+    # Built for MIXER_FORMAT, which the game also pins the mixer to
+    pre_init_mixer()
+    pygame.mixer.init()
+    tts = TTSManager(backend=TTS_BACKEND, bundle_path=None)
+    texts = get_speech_texts()
+    tts.build_bundle(texts, AUDIO_BUNDLE_PATH, max_workers=TTS_PRELOAD_WORKERS)
+    tts.shutdown()
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
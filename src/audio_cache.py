@@ -0,0 +1,198 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+
+class DiskCacheError(OSError):
+    """The cache directory could not be written, as opposed to a failed write_func"""
+
+class AudioDiskCache:
+    """
+    On-disk cache of synthesized clips, indexed by a JSON manifest.
+
+    Every entry records the parameters that produced it (text, language, speed, backend),
+    its size, an md5 checksum and when it was last used. Clips are written to a temp file
+    and renamed into place, so an interrupted run never leaves a truncated clip behind.
+    The manifest is written by save(), which callers run after a batch of stores.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+    # Files the manifest does not know are only deleted once this old: younger ones may
+    # be a clip another game process is writing or has not put in its manifest yet
+    ORPHAN_AGE_SECONDS = 60 * 60
+
+    def __init__(self, cache_dir, max_bytes=100 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.manifest_path = os.path.join(cache_dir, self.MANIFEST_NAME)
+        self.entries = {} # key -> {"file", "params", "size", "checksum", "last_used"}
+        self.size_bytes = 0
+        self._dirty = False
+        # Preload threads and the TTS worker store clips at the same time
+        self._lock = threading.RLock()
+
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        self._load_manifest()
+        self.validate()
+
+    @staticmethod
+    def make_key(params):
+        """Stable cache key for a dict of synthesis parameters"""
+        blob = json.dumps(params, sort_keys=True, ensure_ascii=False)
+        return hashlib.md5(blob.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _checksum(path):
+        digest = hashlib.md5()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(65536), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get("entries", {})
+        except FileNotFoundError:
+            self.entries = {}
+        except (ValueError, OSError) as e:
+            print(f"TTS cache manifest unreadable ({e}), starting a new one")
+            self.entries = {}
+
+    def validate(self):
+        """Drop entries whose file is missing or damaged and delete files the manifest does not know"""
+        with self._lock:
+            removed = 0
+            for key, entry in list(self.entries.items()):
+                path = os.path.join(self.cache_dir, entry["file"])
+                try:
+                    ok = os.path.getsize(path) == entry["size"] and self._checksum(path) == entry["checksum"]
+                except OSError:
+                    ok = False
+                if not ok:
+                    self._remove(key)
+                    removed += 1
+
+            # Leftover temp files from interrupted writes, and clips from older cache layouts
+            known = {entry["file"] for entry in self.entries.values()}
+            known.add(self.MANIFEST_NAME)
+            cutoff = time.time() - self.ORPHAN_AGE_SECONDS
+            for name in os.listdir(self.cache_dir):
+                if name not in known:
+                    path = os.path.join(self.cache_dir, name)
+                    try:
+                        if os.path.getmtime(path) < cutoff:
+                            os.remove(path)
+                    except OSError:
+                        pass
+
+            self.size_bytes = sum(entry["size"] for entry in self.entries.values())
+            if removed:
+                print(f"TTS cache: dropped {removed} invalid clips")
+                self._dirty = True
+            self._evict()
+            self.save()
+
+    def lookup(self, key):
+        """Path of the cached clip for key, or None"""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            entry["last_used"] = time.time()
+            self._dirty = True
+            return os.path.join(self.cache_dir, entry["file"])
+
+    def store(self, key, params, write_func, extension):
+        """
+        Create a clip through write_func(tmp_path) and add it to the cache
+
+        Returns:
+            Final path of the clip. Exceptions from write_func propagate and leave no file behind;
+            failures of the cache directory itself raise DiskCacheError.
+        """
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix=f"{key}.", suffix=f".tmp.{extension}", dir=self.cache_dir)
+            os.close(fd)
+        except OSError as e:
+            raise DiskCacheError(f"cannot create a file in {self.cache_dir}: {e}") from e
+        try:
+            write_func(tmp_path)
+            size = os.path.getsize(tmp_path)
+            if size == 0:
+                raise RuntimeError("empty audio file")
+            filename = f"{key}.{extension}"
+            try:
+                checksum = self._checksum(tmp_path)
+                os.replace(tmp_path, os.path.join(self.cache_dir, filename))
+            except OSError as e:
+                raise DiskCacheError(f"cannot store {filename}: {e}") from e
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        with self._lock:
+            self._remove(key, delete_file=False)
+            self.entries[key] = {
+                "file": filename,
+                "params": params,
+                "size": size,
+                "checksum": checksum,
+                "last_used": time.time(),
+            }
+            self.size_bytes += size
+            self._evict(keep=key)
+            self._dirty = True
+        return os.path.join(self.cache_dir, filename)
+
+    def invalidate_path(self, path):
+        """Forget and delete a clip, e.g. after it failed to decode"""
+        filename = os.path.basename(path)
+        with self._lock:
+            for key, entry in list(self.entries.items()):
+                if entry["file"] == filename:
+                    self._remove(key)
+                    self._dirty = True
+                    return
+
+    def _remove(self, key, delete_file=True):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        self.size_bytes -= entry["size"]
+        if delete_file:
+            try:
+                os.remove(os.path.join(self.cache_dir, entry["file"]))
+            except OSError:
+                pass
+
+    def _evict(self, keep=None):
+        """Remove least recently used clips until the cache fits in max_bytes"""
+        if self.size_bytes <= self.max_bytes:
+            return
+        for key in sorted(self.entries, key=lambda k: self.entries[k]["last_used"]):
+            if self.size_bytes <= self.max_bytes:
+                break
+            if key != keep:
+                self._remove(key)
+                self._dirty = True
+
+    def save(self):
+        """Write the manifest atomically if anything changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_path = self.manifest_path + ".tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({"entries": self.entries}, f, ensure_ascii=False)
+                os.replace(tmp_path, self.manifest_path)
+                self._dirty = False
+            except OSError as e:
+                print(f"Failed to save TTS cache manifest: {e}")
@@ -0,0 +1,112 @@
+import pygame
+
+# Named speech channels. A busy channel lowers the volume of lower priority channels to
+# duck_to, and silences the channels listed in stops (which can't start while it plays).
+DEFAULT_CHANNELS = {
+    "letters": {"priority": 0, "volume": 1.0, "duck_to": 1.0, "stops": []},
+    "narration": {"priority": 1, "volume": 1.0, "duck_to": 0.4, "stops": []},
+    "feedback": {"priority": 2, "volume": 1.0, "duck_to": 0.3, "stops": ["letters"]},
+}
+
+class MixerChannel:
+    """A reserved pygame.mixer.Channel with its mixing rules"""
+
+    def __init__(self, name, channel, priority, volume=1.0, duck_to=1.0, stops=()):
+        self.name = name
+        self.channel = channel
+        self.priority = priority
+        self.volume = volume
+        self.duck_to = duck_to
+        self.stops = list(stops)
+        self.sound = None # Sound that was started last
+        # Posted to the event queue every time a sound on this channel ends
+        self.end_event = pygame.event.custom_type()
+        channel.set_endevent(self.end_event)
+
+    def is_busy(self):
+        return self.channel.get_busy()
+
+class AudioMixer:
+    """Speech mixing over a fixed set of named, reused pygame.mixer.Channel objects"""
+
+    def __init__(self, channels=None):
+        specs = channels or DEFAULT_CHANNELS
+        # Reserve the first channels so sound effects played with Sound.play() never steal them
+        count = len(specs)
+        if pygame.mixer.get_num_channels() < count:
+            pygame.mixer.set_num_channels(count)
+        pygame.mixer.set_reserved(count)
+
+        self.channels = {}
+        self.end_events = {} # event type -> channel name
+        for index, (name, spec) in enumerate(specs.items()):
+            channel = MixerChannel(name, pygame.mixer.Channel(index), **spec)
+            self.channels[name] = channel
+            self.end_events[channel.end_event] = name
+
+    def channel_for_event(self, event):
+        """Name of the channel whose end event this is, or None"""
+        return self.end_events.get(event.type)
+
+    def can_play(self, name):
+        """False while a busy channel that preempts this one is playing"""
+        for other in self.channels.values():
+            if name in other.stops and other.is_busy():
+                return False
+        return True
+
+    def play(self, name, sound):
+        """
+        Play sound on the named channel, replacing what it was playing
+
+        Returns:
+            True if the sound is playing. Restarting the sound that is already
+            playing is skipped so repeated requests do not cut and reload it.
+        """
+        target = self.channels[name]
+        if not self.can_play(name):
+            return False
+        if target.sound is sound and target.is_busy():
+            return True
+
+        for other_name in target.stops:
+            self.channels[other_name].channel.stop()
+        target.channel.play(sound)
+        target.sound = sound
+        self.update()
+        return True
+
+    def can_queue(self, name):
+        """True if the named channel has a free slot for a follow-up sound"""
+        return self.channels[name].channel.get_queue() is None
+
+    def queue(self, name, sound):
+        """Queue sound to follow the current one without a gap. Returns False if the queue slot is taken."""
+        target = self.channels[name]
+        if not target.is_busy():
+            return self.play(name, sound)
+        if not self.can_queue(name):
+            return False
+        target.channel.queue(sound)
+        target.sound = sound
+        return True
+
+    def is_busy(self, name=None):
+        if name is not None:
+            return self.channels[name].is_busy()
+        return any(channel.is_busy() for channel in self.channels.values())
+
+    def stop(self, name=None):
+        targets = [self.channels[name]] if name is not None else self.channels.values()
+        for target in targets:
+            target.channel.stop()
+            target.sound = None
+
+    def update(self):
+        """Apply ducking: each channel is lowered by the busy higher priority channels"""
+        for target in self.channels.values():
+            factor = 1.0
+            for other in self.channels.values():
+                if other.priority > target.priority and other.is_busy():
+                    factor = min(factor, other.duck_to)
+            target.channel.set_volume(target.volume * factor)
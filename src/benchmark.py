@@ -0,0 +1,312 @@
+import os
+import sys
+import json
+import time
+import argparse
+import pygame
+from src.constants import *
+from src.metrics import Histogram
+from src.display import Display
+
+# Script format (JSON), positions in game (SCREEN_WIDTH x SCREEN_HEIGHT) coordinates:
+#   {"seed": 1, "clicks": [{"frame": 12, "pos": [400, 500], "button": 1}, ...]}
+# A click is delivered as a MOUSEBUTTONDOWN event in the handle_events() call of its frame.
+# Frames are numbered in fixed simulation steps and a replay runs exactly one step per
+# frame, so the same seed and clicks always replay the same game, whatever the speed of
+# the machine.
+
+# Frames the scripted player waits between two clicks
+THINK_FRAMES = 15
+# Frames a replay keeps running after the last click if the game doesn't quit by itself
+TAIL_FRAMES = 10 * FPS
+
+class SilentTTS:
+    """Stand-in for TTSManager that plays nothing and records what would have been spoken"""
+
+    def __init__(self):
+        self.spoken = []
+        self._callbacks = []
+
+    def speak(self, text, wait=False, priority=0, on_done=None):
+        self.spoken.append(text)
+        if on_done:
+            self._callbacks.append(on_done)
+
+    def speak_letter(self, letter, on_done=None):
+        self.speak(letter, on_done=on_done)
+
+    def speak_word(self, word, on_done=None):
+        self.speak(word, on_done=on_done)
+
+    def speak_instruction(self, instruction, on_done=None):
+        self.speak(instruction, on_done=on_done)
+
+    def speak_feedback(self, message, on_done=None):
+        self.speak(message, on_done=on_done)
+
+    def when_idle(self, callback):
+        self._callbacks.append(callback)
+
+    def is_idle(self):
+        return True
+
+    def needs_update(self):
+        return bool(self._callbacks)
+
+    def handle_event(self, event):
+        return False
+
+    def update(self):
+        # Speech "finishes" on the frame after it was requested
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def preload(self, text_list, max_workers=8, progress_callback=None):
+        return {}
+
+    def cancel_all(self):
+        self._callbacks = []
+
+    def stop(self):
+        self.cancel_all()
+
+    def dump_metrics(self, path):
+        pass
+
+    def shutdown(self):
+        pass
+
+def init_headless(scale=1.0):
+    """Initialize pygame with the SDL dummy drivers and return an off-screen Display"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    pygame.init()
+    return Display.create(scale)
+
+def make_click(pos, button=1):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=tuple(pos), button=button)
+
+def game_phase(game):
+    """Name of the part of the game a frame belongs to, for per-phase timings"""
+    if game.state == "PLAYING":
+        return f"level {game.current_level_index + 1}"
+    return game.state.lower()
+
+def _wagon_click_point(game, wagon):
+    """A point inside wagon that no earlier clickable wagon covers (raining wagons overlap)"""
+    others = []
+    for other in game.wagons:
+        if other is wagon:
+            break
+        if game.can_pick(other):
+            others.append(other.rect)
+    rect = wagon.rect
+    for dx in range(rect.width // 2, rect.width, 4):
+        for x in (rect.left + dx, rect.right - dx):
+            point = (x, rect.centery)
+            if not any(other.collidepoint(point) for other in others):
+                return point
+    return None
+
+def choose_click(game):
+    """Where a player who never makes mistakes clicks next, or None to wait"""
+    if game.state == "INTRO":
+        return game.start_btn.rect.center
+    if game.state == "SUCCESS":
+        return game.quit_btn.rect.center
+    if game.next_level_btn.enabled:
+        return game.next_level_btn.rect.center
+    # Click ahead: the wagons already on their way fill the next open slots
+    in_flight = [wagon for wagon in (game.selected_wagon, game.arm.held_wagon) if wagon is not None]
+    in_flight.extend(game.arm_jobs)
+    if len(game.arm_jobs) >= ARM_QUEUE_SIZE:
+        return None
+    pre_filled = game.current_level_config["pre_filled"]
+    open_slots = [i for i in range(game.current_position, len(game.phonemes)) if i not in pre_filled]
+    if len(in_flight) >= len(open_slots):
+        return None
+    expected = game.phonemes[open_slots[len(in_flight)]]
+    for wagon in game.wagons:
+        if wagon.letter == expected and wagon.arrived and game.can_pick(wagon) and wagon not in in_flight:
+            point = _wagon_click_point(game, wagon)
+            if point:
+                return point
+    return None
+
+def generate_script(seed, display, think_frames=THINK_FRAMES, max_frames=60 * 60 * FPS):
+    """
+    Play through every level with a scripted player and record its clicks
+
+    Needs a Display (see init_headless). Nothing is drawn.
+    """
+    from src.game import Game
+
+    game = Game(display.canvas, tts=SilentTTS(), seed=seed, display=display)
+    clicks = []
+    next_click = think_frames
+    frame = 0
+    while game.running and frame < max_frames:
+        events = pygame.event.get()
+        if frame >= next_click:
+            pos = choose_click(game)
+            if pos is not None:
+                clicks.append({"frame": frame, "pos": list(pos), "button": 1})
+                events.append(make_click(display.to_canvas(pos)))
+                next_click = frame + think_frames
+        game.handle_events(events)
+        game.update(1.0 / SIM_RATE)
+        frame += 1
+    return {"seed": seed, "clicks": clicks}
+
+def replay(script, display, render_mode=None, max_frames=None):
+    """
+    Replay a script headlessly, drawing every frame, and time each step
+
+    Returns:
+        Report dict with per-step timings ("steps"), frame times per part of the
+        game ("phases"), profiler sections ("sections"), all in milliseconds, and
+        whether the game was finished.
+    """
+    from src.game import Game, LEVELS
+
+    tts = SilentTTS()
+    game = Game(display.canvas, tts=tts, seed=script.get("seed"), display=display)
+    if render_mode:
+        game.render_mode = render_mode
+    # Sub-step timings (wagons.update, draw.dynamic, ...) come from the frame profiler
+    game.profiler.enabled = True
+    game.profiler.window = None
+
+    clicks = {}
+    for click in script["clicks"]:
+        clicks.setdefault(click["frame"], []).append(click)
+    if max_frames is None:
+        max_frames = max(clicks, default=0) + TAIL_FRAMES
+
+    # Keep every sample, the percentiles are over the whole run
+    steps = {name: Histogram(window=None) for name in ("events", "update", "draw", "frame")}
+    phases = {}
+    completed = False
+    frame = 0
+    start = time.perf_counter()
+    while game.running and frame < max_frames:
+        phase = phases.setdefault(game_phase(game), Histogram(window=None))
+        game.profiler.begin_frame()
+        t0 = time.perf_counter()
+        events = pygame.event.get()
+        events.extend(make_click(display.to_canvas(click["pos"]), click.get("button", 1))
+                      for click in clicks.get(frame, ()))
+        game.handle_events(events)
+        t1 = time.perf_counter()
+        game.update(1.0 / SIM_RATE)
+        t2 = time.perf_counter()
+        game.draw()
+        t3 = time.perf_counter()
+        game.profiler.end_frame()
+
+        steps["events"].add((t1 - t0) * 1000)
+        steps["update"].add((t2 - t1) * 1000)
+        steps["draw"].add((t3 - t2) * 1000)
+        steps["frame"].add((t3 - t0) * 1000)
+        phase.add((t3 - t0) * 1000)
+        completed = completed or game.state == "SUCCESS"
+        frame += 1
+    wall_time = time.perf_counter() - start
+    game.tts.shutdown()
+
+    return {
+        "seed": script.get("seed"),
+        "render_mode": game.render_mode,
+        "render_scale": display.scale,
+        "frames": frame,
+        "wall_time": wall_time,
+        "fps": frame / wall_time if wall_time else 0.0,
+        "completed": completed,
+        "levels": len(LEVELS),
+        "spoken": len(tts.spoken),
+        "steps": {name: hist.to_dict() for name, hist in steps.items()},
+        "phases": {name: hist.to_dict() for name, hist in phases.items()},
+        "sections": {name: hist.to_dict() for name, hist in game.profiler.histograms.items()},
+    }
+
+def record(path, seed):
+    """Play the game in a normal window and save every click with its simulation step"""
+    from src.game import Game
+
+    pygame.init()
+    display = Display.create(RENDER_SCALE, FULLSCREEN)
+    pygame.display.set_caption("Șantierul Cuvintelor (înregistrare)")
+    game = Game(display.canvas, seed=seed, display=display)
+    clicks = []
+    elapsed = 0.0
+    game.clock.tick()
+    while game.running:
+        events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                # The replay delivers it before the same step runs
+                pos = display.to_game(event.pos)
+                clicks.append({"frame": game.sim_steps, "pos": list(pos), "button": event.button})
+        game.handle_events(events)
+        game.advance(elapsed)
+        game.draw()
+        elapsed = game.clock.tick(FPS) / 1000
+    game.tts.shutdown()
+    save_script({"seed": seed, "clicks": clicks}, path)
+    print(f"Recorded {len(clicks)} clicks over {game.sim_steps} steps to {path}")
+
+def load_script(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_script(script, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(script, f, indent=2)
+
+def print_report(report):
+    print(f"seed={report['seed']} render_mode={report['render_mode']} render_scale={report['render_scale']:g} "
+          f"frames={report['frames']} "
+          f"wall={report['wall_time']:.2f}s ({report['fps']:.0f} fps) completed={report['completed']}")
+    print(f"{'ms':<24}{'mean':>8}{'p50':>8}{'p90':>8}{'p99':>8}{'max':>8}")
+    for title in ("steps", "phases", "sections"):
+        rows = report[title]
+        print(f"-- {title}")
+        for name, stats in rows.items():
+            print(f"{name:<24}{stats['mean']:>8.3f}{stats['p50']:>8.3f}{stats['p90']:>8.3f}"
+                  f"{stats['p99']:>8.3f}{stats['max']:>8.3f}")
+
+def main(argv=None):
+    """Headless frame-time benchmark: python -m src.benchmark [--script FILE] [--json FILE]"""
+    parser = argparse.ArgumentParser(description="Replay a scripted game without a display and report frame timings")
+    parser.add_argument("--script", help="click script to replay (default: generated perfect play)")
+    parser.add_argument("--seed", type=int, default=1, help="seed for the generated script (default: 1)")
+    parser.add_argument("--save-script", help="write the replayed script to this file")
+    parser.add_argument("--record", help="play in a window and save the clicks to this file instead")
+    parser.add_argument("--render-mode", choices=["dirty", "full"], help="override RENDER_MODE")
+    parser.add_argument("--render-scale", type=float, default=1.0, help="internal render resolution relative to the game (default: 1)")
+    parser.add_argument("--max-frames", type=int, help="stop the replay after this many frames")
+    parser.add_argument("--json", help="write the report to this file")
+    args = parser.parse_args(argv)
+
+    if args.record:
+        record(args.record, args.seed)
+        pygame.quit()
+        return 0
+
+    display = init_headless(args.render_scale)
+    script = load_script(args.script) if args.script else generate_script(args.seed, display)
+    if args.save_script:
+        save_script(script, args.save_script)
+
+    report = replay(script, display, render_mode=args.render_mode, max_frames=args.max_frames)
+    pygame.quit()
+
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    return 0 if report["completed"] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,11 @@ import pygame
 # Screen dimensions
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-FPS = 60
+FPS = 60 # Render rate
+SIM_RATE = 60 # Fixed simulation steps per second, independent of FPS
+MAX_FRAME_TIME = 0.25 # Longer frames (e.g. window dragged) are only simulated up to this many seconds
+IDLE_AFTER_FRAMES = 2 # Full-rate frames drawn after everything stopped moving, before idling
+IDLE_WAIT_MS = 250 # Longest wait for an event while idle
 
 # Colors
 WHITE = (255, 255, 255)
@@ -22,7 +26,7 @@ TEXT_COLOR = (80, 40, 0) # Dark Brown
 # Game settings
 WAGON_WIDTH = 80
 WAGON_HEIGHT = 80
-WAGON_SPEED = 2
+WAGON_SPEED = 120 # pixels per second
 CONVEYOR_Y = 150
 SLOT_WIDTH = 90
 SLOT_HEIGHT = 90
@@ -45,3 +49,34 @@ ARM_COLOR = (240, 230, 200)
 JOINT_COLOR = (100, 150, 200)
 CLAW_COLOR = (200, 80, 80)
 SEGMENT_LENGTH = 400
+ARM_SPEED = 300 # pixels per second
+ARM_QUEUE_SIZE = 4 # Wagon clicks remembered while the arm is busy
+
+# Text-to-Speech
+TTS_PRELOAD_WORKERS = 8 # Parallel gTTS requests when preloading
+TTS_BACKEND = "auto" # "auto", "gtts" (online) or "pyttsx3" (offline)
+TTS_SOUND_CACHE_BYTES = 32 * 1024 * 1024 # Memory budget for decoded speech clips
+TTS_DISK_CACHE_BYTES = 100 * 1024 * 1024 # Size limit of the synthesized clip cache on disk
+AUDIO_BUNDLE_PATH = "assets/audio/speech.bundle" # Built with: python -m src.audio_bundle
+MIXER_FORMAT = (44100, -16, 2) # Frequency, sample size, channels the mixer is pinned to (see pre_init_mixer)
+TTS_METRICS_PATH = "tts_metrics.json" # Written on F9, and on exit if TTS_METRICS_ON_EXIT
+TTS_METRICS_ON_EXIT = False
+
+# Tile hover animation
+HOVER_SCALE = 1.15
+HOVER_SCALE_FRAMES = 16 # Precomputed sizes between 1.0 and HOVER_SCALE
+
+# Rendering: "full" redraws and flips the whole screen every frame,
+# "dirty" composites static layers once and updates only changed rects
+RENDER_MODE = "dirty"
+# Internal render resolution relative to SCREEN_WIDTH x SCREEN_HEIGHT (e.g. 0.5 - 2). The game
+# is drawn at that size and SDL scales it to the window on the GPU; 0.5 draws a quarter of the
+# pixels. FULLSCREEN fills the screen.
+RENDER_SCALE = 1.0
+FULLSCREEN = False
+
+# Frame profiler: F3 shows the timing overlay (and turns profiling on), F10 saves the profile
+PROFILER_ENABLED = False
+PROFILER_TRACE_FRAMES = 600 # Frames kept for the exported trace
+PROFILER_JSON_PATH = "frame_profile.json"
+PROFILER_TRACE_PATH = "frame_trace.json" # Chrome trace format (chrome://tracing, Perfetto)
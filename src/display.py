@@ -0,0 +1,184 @@
+import math
+import weakref
+import pygame
+from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Mouse events whose pos is mapped from canvas to game coordinates
+MOUSE_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+
+class Canvas:
+    """
+    A surface of scale x SCREEN_WIDTH x SCREEN_HEIGHT pixels, drawn on in game coordinates
+
+    Supports the Surface methods the game draws with (blit, blits, fill, set_clip,
+    get_rect, copy) plus line/circle/rect, scaling every position and size. Source
+    images are resized once and cached for as long as they exist, so a source must not
+    be drawn on after it has been blitted here. At scale 0.5 a frame touches a quarter
+    of the pixels.
+    """
+
+    def __init__(self, surface, scale, cache=None):
+        self.surface = surface
+        self.scale = scale
+        self.size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        self._scaled = cache if cache is not None else weakref.WeakKeyDictionary()
+
+    def get_rect(self):
+        return pygame.Rect((0, 0), self.size)
+
+    def get_size(self):
+        return self.size
+
+    def to_canvas(self, pos):
+        return (round(pos[0] * self.scale), round(pos[1] * self.scale))
+
+    def to_game(self, pos):
+        """Game coordinates of the center of a canvas pixel"""
+        x = min(self.size[0] - 1, int((pos[0] + 0.5) / self.scale))
+        y = min(self.size[1] - 1, int((pos[1] + 0.5) / self.scale))
+        return (x, y)
+
+    def to_canvas_rect(self, rect):
+        """Smallest canvas rect covering the game rect, plus a pixel for rounding at its edges"""
+        rect = pygame.Rect(rect)
+        left = math.floor(rect.left * self.scale) - 1
+        top = math.floor(rect.top * self.scale) - 1
+        right = math.ceil(rect.right * self.scale) + 1
+        bottom = math.ceil(rect.bottom * self.scale) + 1
+        return pygame.Rect(left, top, right - left, bottom - top).clip(self.surface.get_rect())
+
+    def scaled(self, source):
+        """source resized to the canvas scale, made once per source surface"""
+        image = self._scaled.get(source)
+        if image is None:
+            width, height = source.get_size()
+            size = (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+            try:
+                image = pygame.transform.smoothscale(source, size)
+            except ValueError:
+                # smoothscale only takes 24 and 32 bit surfaces
+                image = pygame.transform.scale(source, size)
+            self._scaled[source] = image
+        return image
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        image = source.surface if isinstance(source, Canvas) else self.scaled(source)
+        x, y = self.to_canvas(dest[:2])
+        if area is not None:
+            # Widened like every canvas rect, so the destination moves with it
+            corner = self.to_canvas(area[:2])
+            area = self.to_canvas_rect(area)
+            x += area.left - corner[0]
+            y += area.top - corner[1]
+        return self.surface.blit(image, (x, y), area, special_flags)
+
+    def blits(self, blit_sequence, doreturn=1):
+        rects = [self.blit(*args) for args in blit_sequence]
+        return rects if doreturn else None
+
+    def fill(self, color, rect=None):
+        return self.surface.fill(color, None if rect is None else self.to_canvas_rect(rect))
+
+    def set_clip(self, rect):
+        self.surface.set_clip(None if rect is None else self.to_canvas_rect(rect))
+
+    def copy(self):
+        """Another canvas of the same size, sharing the cache of scaled sources"""
+        return Canvas(self.surface.copy(), self.scale, self._scaled)
+
+    def line(self, color, start, end, width=1):
+        pygame.draw.line(self.surface, color, self.to_canvas(start), self.to_canvas(end),
+                         max(1, round(width * self.scale)))
+
+    def circle(self, color, center, radius):
+        pygame.draw.circle(self.surface, color, self.to_canvas(center), max(1, round(radius * self.scale)))
+
+    def rect(self, color, rect):
+        rect = pygame.Rect(rect)
+        left, top = self.to_canvas(rect.topleft)
+        right, bottom = self.to_canvas(rect.bottomright)
+        pygame.draw.rect(self.surface, color, (left, top, right - left, bottom - top))
+
+# Primitives for code that draws on either a Surface or a Canvas
+
+def draw_line(surface, color, start, end, width=1):
+    if isinstance(surface, Canvas):
+        surface.line(color, start, end, width)
+    else:
+        pygame.draw.line(surface, color, start, end, width)
+
+def draw_circle(surface, color, center, radius):
+    if isinstance(surface, Canvas):
+        surface.circle(color, center, radius)
+    else:
+        pygame.draw.circle(surface, color, center, radius)
+
+def draw_rect(surface, color, rect):
+    if isinstance(surface, Canvas):
+        surface.rect(color, rect)
+    else:
+        pygame.draw.rect(surface, color, rect)
+
+class Display:
+    """
+    The window and the canvas the game draws on
+
+    With a render scale of 1 the game draws straight to the window. Otherwise it draws
+    on a Canvas of scale x SCREEN_WIDTH x SCREEN_HEIGHT pixels, which is the window's
+    own surface: pygame.SCALED lets SDL stretch it to the window on the GPU. Mouse
+    positions arrive in canvas pixels and are mapped back to game coordinates.
+    """
+
+    def __init__(self, window, scale=1.0):
+        self.window = window
+        self.scale = scale
+        self.canvas = window if scale == 1.0 else Canvas(window, scale)
+
+    @classmethod
+    def create(cls, scale=1.0, fullscreen=False):
+        """
+        Open the window
+
+        Args:
+            scale: Internal render resolution relative to SCREEN_WIDTH x SCREEN_HEIGHT
+                (e.g. 0.5 - 2). Frame cost follows the number of pixels drawn.
+            fullscreen: Fill the screen; SDL scales the canvas and keeps the aspect ratio
+        """
+        size = (round(SCREEN_WIDTH * scale), round(SCREEN_HEIGHT * scale))
+        flags = (pygame.SCALED | pygame.FULLSCREEN) if fullscreen else 0
+        if scale != 1.0 and not fullscreen:
+            # The window is sized by SDL to a whole multiple of the canvas that fits the desktop
+            flags = pygame.SCALED
+        return cls(pygame.display.set_mode(size, flags), scale)
+
+    @property
+    def is_scaled(self):
+        return self.scale != 1.0
+
+    def to_game(self, pos):
+        """Canvas pixel (e.g. a mouse position) to game coordinates"""
+        return self.canvas.to_game(pos) if self.is_scaled else pos
+
+    def to_canvas(self, pos):
+        """Game coordinates to a canvas pixel, e.g. for a synthetic click"""
+        return self.canvas.to_canvas(pos) if self.is_scaled else pos
+
+    def map_event(self, event):
+        """The event with its mouse position in game coordinates"""
+        if not self.is_scaled or event.type not in MOUSE_EVENTS:
+            return event
+        attributes = dict(event.dict)
+        attributes["pos"] = self.to_game(event.pos)
+        return pygame.event.Event(event.type, attributes)
+
+    def mouse_pos(self):
+        return self.to_game(pygame.mouse.get_pos())
+
+    def present(self, rects=None):
+        """Show the whole canvas, or only the given game rects"""
+        if rects is None:
+            pygame.display.flip()
+        elif self.is_scaled:
+            pygame.display.update([self.canvas.to_canvas_rect(rect) for rect in rects])
+        else:
+            pygame.display.update(rects)
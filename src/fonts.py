@@ -0,0 +1,122 @@
+import pygame
+from collections import OrderedDict
+
+# (face, size, bold, italic) -> pygame.font.Font
+_fonts = {}
+
+def get_font(face, size, bold=False, italic=False, fallback_size=None):
+    """
+    Shared font for the given face and style, loaded only once
+
+    Falls back to pygame's default font at fallback_size (or size) if the
+    system font can't be loaded.
+    """
+    key = (face, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        try:
+            font = pygame.font.SysFont(face, size, bold=bold, italic=italic)
+        except:
+            font = pygame.font.Font(None, fallback_size or size)
+        _fonts[key] = font
+    return font
+
+def clear_fonts():
+    """Forget all loaded fonts and their rendered text, e.g. after pygame.font.quit()"""
+    _fonts.clear()
+    text_cache.clear()
+    _paragraphs.clear()
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (text, font, color, antialias)"""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._surfaces = OrderedDict()
+
+    def render(self, font, text, color, antialias=True):
+        """Same as font.render(text, antialias, color), but rendered only once"""
+        key = (text, font, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._surfaces),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+# Shared cache for HUD and message text
+text_cache = TextCache()
+
+def render_text(font, text, color, antialias=True):
+    """Render text through the shared text_cache. Don't draw on the returned surface."""
+    return text_cache.render(font, text, color, antialias)
+
+def wrap_text(text, font, max_width):
+    """Split text into lines no wider than max_width, measuring with font.size (no rendering)"""
+    lines = []
+    current_line = []
+
+    for word in text.split(' '):
+        current_line.append(word)
+        if font.size(' '.join(current_line))[0] > max_width and len(current_line) > 1:
+            current_line.pop()
+            lines.append(' '.join(current_line))
+            current_line = [word]
+
+    if current_line:
+        lines.append(' '.join(current_line))
+    return lines
+
+# (text, font, max_width, color, line_spacing) -> (surface, first line center y)
+_paragraphs = OrderedDict()
+MAX_PARAGRAPHS = 32
+
+def render_paragraph(text, font, max_width, color, line_spacing=40):
+    """
+    Word-wrapped, centered paragraph rendered once into a single surface
+
+    Returns:
+        (surface, first_line_y) - first_line_y is where the center of the first
+        line sits inside the surface
+    """
+    key = (text, font, max_width, tuple(color), line_spacing)
+    cached = _paragraphs.get(key)
+    if cached is not None:
+        _paragraphs.move_to_end(key)
+        return cached
+
+    lines = wrap_text(text, font, max_width)
+    width = max(font.size(line)[0] for line in lines)
+    half_line = max(line_spacing // 2, (font.get_linesize() + 1) // 2)
+    height = 2 * half_line + (len(lines) - 1) * line_spacing
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    for i, line in enumerate(lines):
+        line_surf = font.render(line, True, color)
+        rect = line_surf.get_rect(center=(width // 2, half_line + i * line_spacing))
+        # Lines don't overlap, MAX copies their alpha exactly onto the transparent surface
+        surface.blit(line_surf, rect, special_flags=pygame.BLEND_RGBA_MAX)
+
+    _paragraphs[key] = (surface, half_line)
+    if len(_paragraphs) > MAX_PARAGRAPHS:
+        _paragraphs.popitem(last=False)
+    return surface, half_line
@@ -1,9 +1,15 @@
 import pygame
 import random
 import sys
+from collections import deque
 from src.constants import *
 from src.sprites import Wagon, Button, Slot, RoboticArm, SpeakerButton
 from src.tts import TTSManager
+from src.fonts import get_font, render_text, render_paragraph
+from src.assets import AssetManager
+from src.profiler import FrameProfiler
+from src.scheduler import FrameScheduler
+from src.display import Display, draw_circle, draw_rect
 
 # Level Definitions
 LEVELS = [
@@ -36,71 +42,101 @@ LEVELS = [
     }
 ]
 
+INTRO_TEXT = "Salutare, micule constructor! Bine ai venit pe Șantierul Cuvintelor. Aici, literele sunt ca niște cărămizi, iar noi avem nevoie de ajutorul tău pentru a construi cuvinte puternice. Ești gata să pornim macaraua și să asamblăm cuvinte? Haide să începem!"
+OUTRO_TEXT = "Felicitări, Maestre Constructor! Ai terminat toate nivelurile cu succes. Șantierul Cuvintelor arată minunat datorită ție. Ești un adevărat campion al literelor!"
+
+def get_speech_texts():
+    """Every phrase the game can speak - used for preloading and building the audio bundle"""
+    texts = []
+    # General messages
+    texts.extend([
+        "Literă greșită, mai încearcă",
+        "Literă greșită! Mai încearcă!", 
+        "Felicitări! Nivel Complet!",
+        "Cuvântul nu este complet, mai încearcă"
+    ])
+    
+    texts.append(INTRO_TEXT)
+    texts.append(OUTRO_TEXT)
+    
+    # Level specific content
+    for level in LEVELS:
+        word = level["target_word"]
+        # Instruction
+        if level["id"] == 1:
+            texts.append(f"Da click pe litere in ordine si construieste cuvantul {word}")
+        else:
+            texts.append(f"Nivelul {level['id']}. Construiește cuvântul {word}")
+        
+        # Completion
+        texts.append(f"Felicitări! Cuvântul {word} este complet!")
+        texts.append(f"Perfect! Cuvântul {word} este corect!")
+        texts.append(word)
+        
+        # Letters
+        all_letters = level["phonemes"] + level["distractors"]
+        for letter in all_letters:
+            texts.append(letter)
+    
+    # Remove duplicates, keeping order
+    return list(dict.fromkeys(texts))
+
 class Game:
-    def __init__(self, screen):
+    def __init__(self, screen, tts=None, seed=None, display=None):
+        """
+        Args:
+            screen: Surface or Canvas to draw on, in SCREEN_WIDTH x SCREEN_HEIGHT coordinates
+            tts: Speech manager to use instead of a new TTSManager (e.g. a silent stub)
+            seed: Seed for wagon shuffling and image placement, None for a random game
+            display: Display that shows screen, needed when screen is a scaled Canvas
+        """
         self.screen = screen
+        self.display = display or Display(screen)
+        self.rng = random.Random(seed)
+        self.render_mode = RENDER_MODE
         self.clock = pygame.time.Clock()
         self.running = True
         self.state = "INTRO" # INTRO, PLAYING, SUCCESS
         self.intro_audio_played = False
         self.success_audio_played = False
         
-        try:
-            self.font = pygame.font.SysFont('Comic Sans MS', 42, bold=True)
-            self.story_font = pygame.font.SysFont('Comic Sans MS', 28)
-        except:
-            self.font = pygame.font.Font(None, 48)
-            self.story_font = pygame.font.Font(None, 32)
+        # Frame timings, off unless PROFILER_ENABLED or the overlay is opened with F3
+        self.profiler = FrameProfiler(PROFILER_ENABLED, trace_frames=PROFILER_TRACE_FRAMES)
+        # Full frame rate only while something moves
+        self.scheduler = FrameScheduler(FPS, IDLE_AFTER_FRAMES, IDLE_WAIT_MS)
+        self.profiler.reporters["scheduler"] = self.scheduler
+        
+        self.font = get_font('Comic Sans MS', 42, bold=True, fallback_size=48)
+        self.story_font = get_font('Comic Sans MS', 28, fallback_size=32)
         
         # Text-to-Speech Manager
-        self.tts = TTSManager()
+        if tts is None:
+            tts = TTSManager(backend=TTS_BACKEND, sound_cache_bytes=TTS_SOUND_CACHE_BYTES,
+                             disk_cache_bytes=TTS_DISK_CACHE_BYTES, bundle_path=AUDIO_BUNDLE_PATH,
+                             metrics_path=TTS_METRICS_PATH if TTS_METRICS_ON_EXIT else None)
+        self.tts = tts
+        self.profiler.instrument(self.tts, ["handle_event", "speak_letter", "speak_word",
+                                            "speak_instruction", "speak_feedback"], "tts")
+        
+        # Intro and Outro text
+        self.intro_text = INTRO_TEXT
+        self.outro_text = OUTRO_TEXT
         
         # Preload Audio
         print("Preloading game audio...") 
-        preload_list = []
-        # General messages
-        preload_list.extend([
-            "Literă greșită, mai încearcă",
-            "Literă greșită! Mai încearcă!", 
-            "Felicitări! Nivel Complet!",
-            "Cuvântul nu este complet, mai încearcă"
-        ])
-        
-        # Intro and Outro text
-        self.intro_text = "Salutare, micule constructor! Bine ai venit pe Șantierul Cuvintelor. Aici, literele sunt ca niște cărămizi, iar noi avem nevoie de ajutorul tău pentru a construi cuvinte puternice. Ești gata să pornim macaraua și să asamblăm cuvinte? Haide să începem!"
-        self.outro_text = "Felicitări, Maestre Constructor! Ai terminat toate nivelurile cu succes. Șantierul Cuvintelor arată minunat datorită ție. Ești un adevărat campion al literelor!"
-        
-        preload_list.append(self.intro_text)
-        preload_list.append(self.outro_text)
-        
-        # Level specific content
-        for level in LEVELS:
-            word = level["target_word"]
-            # Instruction
-            if level["id"] == 1:
-                preload_list.append(f"Da click pe litere in ordine si construieste cuvantul {word}")
-            else:
-                preload_list.append(f"Nivelul {level['id']}. Construiește cuvântul {word}")
-            
-            # Completion
-            preload_list.append(f"Felicitări! Cuvântul {word} este complet!")
-            preload_list.append(f"Perfect! Cuvântul {word} este corect!")
-            preload_list.append(word)
-            
-            # Letters
-            all_letters = level["phonemes"] + level["distractors"]
-            for letter in all_letters:
-                preload_list.append(letter)
+        self.tts.preload(get_speech_texts(), max_workers=TTS_PRELOAD_WORKERS)
         
-        # Remove duplicates
-        preload_list = list(set(preload_list))
-        self.tts.preload(preload_list)
+        # Images are loaded on first use, converted to the display format and
+        # their scaled versions are cached on disk
+        self.assets = AssetManager()
+        self.assets.register("background", "background.png", alpha=False)
+        self.assets.register_letters()
         
         # Load background and level images
         self.level_images = {}
         try:
-            self.background = pygame.image.load("assets/images/background.png")
-            self.background = pygame.transform.scale(self.background, (SCREEN_WIDTH, SCREEN_HEIGHT))
+            # Scaled with transform.scale, as the background has always been drawn
+            self.background = self.assets.get("background", (SCREEN_WIDTH, SCREEN_HEIGHT), smooth=False)
             print("Background image loaded successfully")
         except Exception as e:
             print(f"Failed to load background: {e}")
@@ -114,11 +150,10 @@ class Game:
         }
         
         for key, filename in image_map.items():
+            self.assets.register(key, f"{filename}.png")
             try:
-                img = pygame.image.load(f"assets/images/{filename}.png").convert_alpha()
                 # Scale to reasonable size e.g., 150x150 max keeping aspect ratio
-                img = pygame.transform.smoothscale(img, (150, 150))
-                self.level_images[key] = img
+                self.level_images[key] = self.assets.get(key, (150, 150))
             except Exception as e:
                  print(f"Failed to load {filename}.png: {e}")
             
@@ -135,6 +170,20 @@ class Game:
         # Robotic Arm
         self.arm = RoboticArm(ARM_BASE_X, ARM_BASE_Y)
         
+        # Letter tiles are shared between wagons, render them all once
+        Wagon.preload_tiles({letter for level in LEVELS for letter in level["phonemes"] + level["distractors"]})
+        
+        # Dirty-rect rendering state
+        self.drawn_state = None
+        self.static_layer = None
+        self.static_key = None
+        self.last_snapshot = {}
+        
+        # Fixed-timestep simulation, see advance()
+        self.sim_accumulator = 0.0
+        self.sim_steps = 0
+        self.alpha = 1.0
+        
         # Level State
         self.current_level_index = 0
         self.setup_level(self.current_level_index)
@@ -157,6 +206,7 @@ class Game:
         self.current_position = 0
         self.completed_letters = []
         self.auto_place = False
+        self.arm_jobs = deque() # Wagons clicked while the arm was busy, picked up in order
         
         # Slots
         self.slots = pygame.sprite.Group()
@@ -200,7 +250,7 @@ class Game:
         needed_indices = [i for i in range(len(self.phonemes)) if i not in level_config["pre_filled"]]
         letters_pool = [self.phonemes[i] for i in needed_indices]
         letters_pool.extend(level_config["distractors"])
-        random.shuffle(letters_pool)
+        self.rng.shuffle(letters_pool)
         
         start_x = 100
         for i, letter in enumerate(letters_pool):
@@ -214,7 +264,7 @@ class Game:
                 target_x = 50 + (spawn_width / (len(letters_pool) + 1)) * (i + 1)
                 
                 # Randomize Y slightly so they don't fall in a perfect line
-                start_y = -WAGON_HEIGHT - random.randint(0, 300)
+                start_y = -WAGON_HEIGHT - self.rng.randint(0, 300)
                 
                 # Target Y is the conveyor belt level (so they land there)
                 # Or maybe they float? Let's land them on the conveyor Y
@@ -224,6 +274,7 @@ class Game:
                 wagon = Wagon(letter, target_x, target_y, target_x, is_raining=True)
                 # Override initial Y position
                 wagon.rect.y = start_y
+                wagon.snap()
                 self.wagons.add(wagon)
                 
             else:
@@ -245,35 +296,126 @@ class Game:
         self.arm.move_to_rest()
         self.arm.release_wagon()
         
-        # Initial instruction
+        # Plan every move the arm can make in this level: rest -> wagon -> slot -> rest,
+        # or slot -> next wagon when clicks are queued
+        stops = [wagon.get_stop_center() for wagon in self.wagons]
+        free_slots = [slot.rect.center for slot in self.slot_list if slot.occupied_by is None]
+        rest = self.arm.rest_pos
+        self.arm.planner.precompute([(rest, stop) for stop in stops] +
+                                    [(stop, slot) for stop in stops for slot in free_slots] +
+                                    [(slot, rest) for slot in free_slots] +
+                                    [(slot, stop) for slot in free_slots for stop in stops])
+        
+        # Initial instruction, a second after any speech still playing has finished
         if not self.state == "INTRO":
-            pygame.time.set_timer(pygame.USEREVENT + 1, 1000, 1)
+            self.tts.when_idle(lambda: pygame.time.set_timer(pygame.USEREVENT + 1, 1000, 1))
         
         # Randomize Level Image Position
         # Safe zones: Left (150, 315), Center (400, 315), Right (650, 315)
         safe_positions = [(150, 315), (400, 315), (650, 315)]
-        self.current_image_pos = random.choice(safe_positions)
+        self.current_image_pos = self.rng.choice(safe_positions)
 
-    def handle_events(self):
-        events = pygame.event.get()
+    def handle_events(self, events=None):
+        """Process one frame of input, pygame.event.get() unless events are given (replays)"""
+        if events is None:
+            events = pygame.event.get()
         for event in events:
+            # Clicks are tested in game coordinates, whatever the render scale
+            event = self.display.map_event(event)
+            
+            # Speech end and clip-ready events only update the TTS playback state
+            if self.tts.handle_event(event):
+                continue
+            
             if event.type == pygame.QUIT:
                 self.running = False
             
+            if event.type in (pygame.VIDEOEXPOSE, getattr(pygame, "WINDOWEXPOSED", pygame.VIDEOEXPOSE)):
+                # The window contents were lost, the dirty renderer has to repaint everything
+                self.drawn_state = None
+            
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                self.tts.dump_metrics(TTS_METRICS_PATH)
+            
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle_overlay()
+                self.drawn_state = None
+            
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F10:
+                self.profiler.export(PROFILER_JSON_PATH, PROFILER_TRACE_PATH)
+            
             if self.state == "INTRO":
                 self.handle_intro_events(event)
             elif self.state == "SUCCESS":
                 self.handle_success_events(event)
             elif self.state == "PLAYING":
                 self.handle_game_event(event)
-                
+        
+        # Start any speech the background TTS worker has finished
+        with self.profiler.section("tts.update"):
+            self.tts.update()
+    
+    def advance(self, elapsed):
+        """
+        Run as many fixed simulation steps as elapsed real seconds cover
+        
+        The leftover fraction of a step is kept for the next frame and sets
+        self.alpha, how far drawing interpolates between the last two steps.
+        """
+        step = 1.0 / SIM_RATE
+        self.sim_accumulator += min(elapsed, MAX_FRAME_TIME)
+        while self.sim_accumulator >= step:
+            self.update(step)
+            self.sim_accumulator -= step
+        self.alpha = self.sim_accumulator / step
+    
+    def update(self, dt):
+        """Advance the level simulation by one fixed step of dt seconds"""
+        section = self.profiler.section
+        self.sim_steps += 1
         if self.state == "PLAYING":
-            self.wagons.update(events)
-            self.update_arm_state()
-            self.arm.update() 
+            with section("wagons.update"):
+                self.wagons.update(dt, self.display.mouse_pos())
+            with section("update_arm_state"):
+                self.update_arm_state()
+            with section("arm.update"):
+                self.arm.update(dt) 
     
     # ... rest of file logic implies start_wagon_pickup is next ...
 
+    def can_pick(self, wagon):
+        """Whether the arm may pick the wagon up: on the belt (or visible when raining), not in a slot or held"""
+        if wagon.current_slot is not None or wagon.being_held:
+            return False
+        # For raining, let's say they can be picked up if they are visible
+        return wagon.arrived or self.current_level_config["spawn_mode"] == "raining"
+    
+    def queue_wagon(self, wagon):
+        """
+        Pick the wagon up now if the arm is free, otherwise remember it for later
+        
+        Returns False if the click is ignored: the wagon is already on its way
+        or the queue is full.
+        """
+        if wagon is self.selected_wagon or wagon in self.arm_jobs:
+            return False
+        if self.arm.state == "idle" and not self.arm.held_wagon and not self.arm_jobs:
+            self.start_wagon_pickup(wagon)
+            return True
+        if len(self.arm_jobs) >= ARM_QUEUE_SIZE:
+            return False
+        self.arm_jobs.append(wagon)
+        return True
+    
+    def start_next_job(self):
+        """Head straight for the next queued wagon that can still be picked. False if there is none."""
+        while self.arm_jobs:
+            wagon = self.arm_jobs.popleft()
+            if self.can_pick(wagon):
+                self.start_wagon_pickup(wagon)
+                return True
+        return False
+    
     def start_wagon_pickup(self, wagon):
         self.selected_wagon = wagon
         self.arm.state = "moving_to_pickup"
@@ -359,10 +501,13 @@ class Game:
                          # Level Complete
                         self.message = f"Felicitări! Nivel Complet!"
                         self.message_color = (255, 165, 0)
-                        self.tts.speak(f"Felicitări! Cuvântul {self.target_word} este complet!")
+                        self.tts.speak_feedback(f"Felicitări! Cuvântul {self.target_word} este complet!")
                         
                         # Show Next Level Button
                         self.next_level_btn.set_enabled(True)
+                        
+                        # Clicks still queued have nothing left to fill
+                        self.arm_jobs.clear()
                             
                         # self.buttons.remove(self.assemble_btn) # Removed
                     else:
@@ -384,14 +529,18 @@ class Game:
                     else:
                         wagon.rect.x = wagon.target_x
                         wagon.rect.y = CONVEYOR_Y
+                    wagon.snap()
                     
                     self.message = "Literă greșită! Mai încearcă!"
                     self.message_color = (220, 50, 50)
-                    self.tts.speak("Literă greșită, mai încearcă")
+                    self.tts.speak_feedback("Literă greșită, mai încearcă")
                 
                 self.arm.release_wagon()
-                self.arm.move_to_rest()
                 self.target_slot = None
+                # Skip the trip back to rest while more wagons are waiting;
+                # each one is checked against current_position when it is placed
+                if not self.start_next_job():
+                    self.arm.move_to_rest()
 
     def check_solution(self):
         # Count filled slots
@@ -406,7 +555,7 @@ class Game:
         if correct_count == len(self.phonemes):
             self.message = f"Perfect! Cuvântul {self.target_word} este corect!"
             self.message_color = (255, 165, 0)
-            self.tts.speak(f"Perfect! Cuvântul {self.target_word} este corect!")
+            self.tts.speak_feedback(f"Perfect! Cuvântul {self.target_word} este corect!")
             self.buttons.add(self.next_level_btn)
             self.buttons.remove(self.assemble_btn)
         else:
@@ -416,28 +565,101 @@ class Game:
             else:
                  self.message = "Ceva nu este corect. Verifică literele!"
             self.message_color = (50, 150, 255)
-            self.tts.speak(self.message)
+            self.tts.speak_feedback(self.message)
 
     def draw(self):
-        if self.background:
-            self.screen.blit(self.background, (0, 0))
-        else:
-            self.screen.fill(WHITE)
+        if self.render_mode == "dirty":
+            self.draw_dirty()
+            return
+        
+        section = self.profiler.section
+        with section("draw.background"):
+            if self.background:
+                self.screen.blit(self.background, (0, 0))
+            else:
+                self.screen.fill(WHITE)
             
         if self.state == "INTRO":
-            self.draw_intro()
+            with section("draw.intro"):
+                self.draw_intro()
         elif self.state == "SUCCESS":
-            self.draw_success()
+            with section("draw.success"):
+                self.draw_success()
         elif self.state == "PLAYING":
             self.draw_game()
+        self.draw_overlay(self.screen)
             
-        pygame.display.flip()
+        with section("display.flip"):
+            self.display.present()
+    
+    def draw_overlay(self, surface):
+        """Frame timing overlay (F3)"""
+        overlay = self.profiler.overlay_surface()
+        if overlay:
+            surface.blit(overlay, (8, 8))
 
+    def draw_dirty(self):
+        """Dirty-rectangle rendering: update only the changed parts of the display"""
+        section = self.profiler.section
+        # The static screens are redrawn every frame only while the timing overlay is open
+        overlay_open = self.state != "PLAYING" and self.profiler.overlay_visible
+        if self.state != self.drawn_state or overlay_open:
+            self.drawn_state = self.state
+            self.static_layer = None
+            if self.state != "PLAYING":
+                # Intro and success screens are static, draw them once
+                with section("draw.screen"):
+                    if self.background:
+                        self.screen.blit(self.background, (0, 0))
+                    else:
+                        self.screen.fill(WHITE)
+                    if self.state == "INTRO":
+                        self.draw_intro()
+                    elif self.state == "SUCCESS":
+                        self.draw_success()
+                self.draw_overlay(self.screen)
+                with section("display.flip"):
+                    self.display.present()
+                return
+        
+        if self.state == "PLAYING":
+            dirty = self.draw_game_dirty()
+            if dirty:
+                with section("display.update"):
+                    self.display.present(dirty)
+
+    def is_quiescent(self):
+        """True when the screen can't change until an event arrives"""
+        # Timers (like the level instruction) post events, which end an idle wait anyway
+        if self.profiler.overlay_visible or self.tts.needs_update():
+            return False
+        if self.state != "PLAYING":
+            return True
+        
+        arm = self.arm
+        if arm.state != "idle" or arm.held_wagon or arm.current_pos != arm.rest_pos or arm.prev_pos != arm.current_pos:
+            return False
+        for wagon in self.wagons:
+            if not (wagon.arrived or wagon.current_slot) or wagon.scale != wagon.target_scale:
+                return False
+            if wagon.prev_center != wagon.rect.center:
+                return False
+        return True
+    
     def run(self):
+        # The simulation runs at SIM_RATE whatever the frame rate, FPS only caps rendering
+        elapsed = 0.0
+        events = None
+        self.scheduler.start()
         while self.running:
-            self.handle_events()
+            self.profiler.begin_frame()
+            with self.profiler.section("events"):
+                self.handle_events(events)
+            self.advance(elapsed)
             self.draw()
-            self.clock.tick(FPS)
+            self.profiler.end_frame()
+            elapsed, events = self.scheduler.end_frame(self.is_quiescent())
+        self.tts.shutdown()
 
     def handle_intro_events(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -476,7 +698,7 @@ class Game:
                             print("Next level button disabled clicked")
                             self.message = "Cuvântul nu este complet!"
                             self.message_color = RED
-                            self.tts.speak("Cuvântul nu este complet, mai încearcă")
+                            self.tts.speak_feedback("Cuvântul nu este complet, mai încearcă")
 
                         button_clicked = True
                         break
@@ -492,24 +714,21 @@ class Game:
                     return
                 
                 # Check if clicking on a wagon
-                if self.arm.state == "idle" and not self.arm.held_wagon:
-                    for wagon in self.wagons:
-                        # Allow picking up if arrived (or close enough for raining?)
-                        # For raining, let's say they can be picked up if they are visible
-                        if wagon.rect.collidepoint(event.pos) and (wagon.arrived or self.current_level_config["spawn_mode"] == "raining") and wagon.current_slot is None:
-                            self.start_wagon_pickup(wagon)
+                for wagon in self.wagons:
+                    if wagon.rect.collidepoint(event.pos) and self.can_pick(wagon):
+                        if self.queue_wagon(wagon):
                             self.tts.speak_letter(wagon.letter)
-                            break
+                        break
 
     def draw_intro(self):
         if not self.intro_audio_played:
-            self.tts.speak(self.intro_text)
+            self.tts.speak_instruction(self.intro_text)
             self.intro_audio_played = True
             
         # Background fallback if needed but main draw handles clear
         
         # Draw Title
-        title_surf = self.font.render("Șantierul Cuvintelor", True, BLUE)
+        title_surf = render_text(self.font, "Șantierul Cuvintelor", BLUE)
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 100))
         self.screen.blit(title_surf, title_rect)
         
@@ -521,10 +740,10 @@ class Game:
         
     def draw_success(self):
         if not self.success_audio_played:
-            self.tts.speak(self.outro_text)
+            self.tts.speak_instruction(self.outro_text)
             self.success_audio_played = True
             
-        title_surf = self.font.render("Felicitări!", True, ORANGE)
+        title_surf = render_text(self.font, "Felicitări!", ORANGE)
         title_rect = title_surf.get_rect(center=(SCREEN_WIDTH // 2, 100))
         self.screen.blit(title_surf, title_rect)
         
@@ -533,80 +752,37 @@ class Game:
         self.screen.blit(self.quit_btn.image, self.quit_btn.rect)
 
     def draw_game(self):
+        with self.profiler.section("draw.static"):
+            self.draw_game_static(self.screen)
+        with self.profiler.section("draw.dynamic"):
+            self.draw_game_dynamic(self.screen)
+    
+    def draw_game_static(self, surface):
+        """Parts of the level that only change when the current slot moves"""
         if self.current_level_config["spawn_mode"] == "conveyor":
-             pygame.draw.rect(self.screen, GRAY, (0, CONVEYOR_Y + WAGON_HEIGHT, SCREEN_WIDTH, 20))
+             draw_rect(surface, GRAY, (0, CONVEYOR_Y + WAGON_HEIGHT, SCREEN_WIDTH, 20))
         else:
-             pygame.draw.rect(self.screen, (100, 200, 100), (0, CONVEYOR_Y + WAGON_HEIGHT, SCREEN_WIDTH, 20))
+             draw_rect(surface, (100, 200, 100), (0, CONVEYOR_Y + WAGON_HEIGHT, SCREEN_WIDTH, 20))
         
-        self.slots.draw(self.screen)
+        for i, slot in enumerate(self.slot_list):
+            slot.set_current(i == self.current_position)
+        self.slots.draw(surface)
         
+        # Pre-filled letters never move
         for slot in self.slot_list:
             if slot.occupied_by and slot.occupied_by not in self.wagons and slot.occupied_by != self.arm.held_wagon:
-                 self.screen.blit(slot.occupied_by.image, slot.occupied_by.rect)
-
-        for wagon in self.wagons:
-            if wagon != self.arm.held_wagon:
-                self.screen.blit(wagon.image, wagon.rect)
+                 surface.blit(slot.occupied_by.image, slot.occupied_by.rect)
         
-        self.arm.draw(self.screen)
-        
-        if self.arm.held_wagon:
-            self.screen.blit(self.arm.held_wagon.image, self.arm.held_wagon.rect)
-        
-        self.buttons.draw(self.screen)
-        
-        try:
-            msg_font = pygame.font.SysFont('Comic Sans MS', 38, bold=True)
-        except:
-            msg_font = pygame.font.Font(None, 44)
-        
-        msg_surf_temp = msg_font.render(self.message, True, self.message_color)
-        msg_width = msg_surf_temp.get_width()
-        if msg_width > SCREEN_WIDTH - 40:
-            try:
-                msg_font = pygame.font.SysFont('Comic Sans MS', 32, bold=True)
-            except:
-                msg_font = pygame.font.Font(None, 38)
-        
-        if self.message:
-            font = pygame.font.SysFont('Comic Sans MS', 48, bold=True)
-            shadow_text = font.render(self.message, True, (0, 0, 0))
-            shadow_rect = shadow_text.get_rect(center=(SCREEN_WIDTH // 2 + 2, 72))
-            self.screen.blit(shadow_text, shadow_rect)
-            
-            text_surface = font.render(self.message, True, self.message_color)
-            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 70))
-            self.screen.blit(text_surface, text_rect)
-            
         if self.current_level_config and "image_key" in self.current_level_config:
             key = self.current_level_config["image_key"]
             if key in self.level_images:
                 img = self.level_images[key]
                 img_rect = img.get_rect(center=self.current_image_pos)
-                self.screen.blit(img, img_rect)
-        
-        try:
-            inst_font = pygame.font.SysFont('Arial', 18, italic=True)
-        except:
-            inst_font = pygame.font.Font(None, 22)
-            
-        if not self.arm.held_wagon:
-             inst_text = "Nivel " + str(self.current_level_index + 1) + "/" + str(len(LEVELS))
-        else:
-             inst_text = f"Plasare litera..."
-             
-        inst_surf = inst_font.render(inst_text, True, (50, 50, 50))
-        inst_rect = inst_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 25))
-        self.screen.blit(inst_surf, inst_rect)
+                surface.blit(img, img_rect)
         
-        try:
-            num_font = pygame.font.SysFont('Arial', 36, bold=True)
-        except:
-            num_font = pygame.font.Font(None, 42)
+        num_font = get_font('Arial', 36, bold=True, fallback_size=42)
             
         for i, slot in enumerate(self.slot_list):
-            slot.set_current(i == self.current_position)
-            
             num_text = ""
             bg_color = None
             text_color = WHITE
@@ -629,35 +805,142 @@ class Game:
                 center_y = slot.rect.top - 25
                 
                 if bg_color == WHITE:
-                    pygame.draw.circle(self.screen, (200, 200, 200), (center_x, center_y), 18)
-                    pygame.draw.circle(self.screen, bg_color, (center_x, center_y), 16)
+                    draw_circle(surface, (200, 200, 200), (center_x, center_y), 18)
+                    draw_circle(surface, bg_color, (center_x, center_y), 16)
                 else:
-                    pygame.draw.circle(self.screen, bg_color, (center_x, center_y), 18)
+                    draw_circle(surface, bg_color, (center_x, center_y), 18)
                 
-                num_surf = num_font.render(num_text, True, text_color)
+                num_surf = render_text(num_font, num_text, text_color)
                 num_rect = num_surf.get_rect(center=(center_x, center_y))
-                self.screen.blit(num_surf, num_rect)
+                surface.blit(num_surf, num_rect)
+    
+    def get_message_blits(self):
+        """(surface, rect) pairs for the message shadow and text"""
+        if not self.message:
+            return []
+        font = get_font('Comic Sans MS', 48, bold=True, fallback_size=56)
+        shadow_text = render_text(font, self.message, (0, 0, 0))
+        shadow_rect = shadow_text.get_rect(center=(SCREEN_WIDTH // 2 + 2, 72))
+        text_surface = render_text(font, self.message, self.message_color)
+        text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, 70))
+        return [(shadow_text, shadow_rect), (text_surface, text_rect)]
+    
+    def get_label_blit(self):
+        """(surface, rect) for the level / placing label at the bottom"""
+        inst_font = get_font('Arial', 18, italic=True, fallback_size=22)
+            
+        if not self.arm.held_wagon:
+             inst_text = "Nivel " + str(self.current_level_index + 1) + "/" + str(len(LEVELS))
+        else:
+             inst_text = f"Plasare litera..."
+             
+        inst_surf = render_text(inst_font, inst_text, (50, 50, 50))
+        inst_rect = inst_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 25))
+        return inst_surf, inst_rect
+    
+    def draw_game_dynamic(self, surface):
+        """Wagons, arm, buttons and text - everything that can change from frame to frame"""
+        for wagon in self.wagons:
+            if wagon != self.arm.held_wagon:
+                surface.blit(wagon.image, wagon.render_rect(self.alpha))
+        
+        self.arm.draw(surface, self.alpha)
+        
+        if self.arm.held_wagon:
+            surface.blit(self.arm.held_wagon.image, self.arm.held_wagon.render_rect(self.alpha))
+        
+        self.buttons.draw(surface)
+        
+        for text_surf, text_rect in self.get_message_blits():
+            surface.blit(text_surf, text_rect)
+        
+        surface.blit(*self.get_label_blit())
+    
+    def get_dynamic_snapshot(self):
+        """Screen rect and a change signature for every dynamic element, keyed by element"""
+        snapshot = {}
+        for wagon in self.wagons:
+            if wagon != self.arm.held_wagon:
+                snapshot[("wagon", id(wagon))] = (wagon.render_rect(self.alpha).copy(), id(wagon.image))
+        
+        held = self.arm.held_wagon
+        snapshot[("arm",)] = (self.arm.get_bounds(self.alpha),
+                              (self.arm.get_render_angles(self.alpha), held is not None))
+        if held:
+            snapshot[("held",)] = (held.render_rect(self.alpha).copy(), (id(held), id(held.image)))
+        
+        for btn in self.buttons:
+            snapshot[("button", id(btn))] = (btn.rect.copy(), getattr(btn, "enabled", True))
+        
+        message_blits = self.get_message_blits()
+        if message_blits:
+            rect = message_blits[0][1].union(message_blits[1][1])
+            snapshot[("message",)] = (rect, (self.message, self.message_color))
+        
+        label_surf, label_rect = self.get_label_blit()
+        snapshot[("label",)] = (label_rect, id(label_surf))
+        
+        overlay = self.profiler.overlay_surface()
+        if overlay:
+            snapshot[("overlay",)] = (overlay.get_rect(topleft=(8, 8)), overlay)
+        return snapshot
+    
+    def draw_game_dirty(self):
+        """
+        Redraw only what changed since the last frame (RENDER_MODE "dirty")
+        
+        Returns:
+            List of screen rects that were redrawn, for Display.present()
+        """
+        section = self.profiler.section
+        static_key = (self.current_level_index, self.current_position)
+        full_redraw = self.static_layer is None or static_key != self.static_key
+        if full_redraw:
+            # Background, conveyor strip, slots, numbers and level image, composited once
+            with section("draw.static"):
+                self.static_layer = self.screen.copy()
+                if self.background:
+                    self.static_layer.blit(self.background, (0, 0))
+                else:
+                    self.static_layer.fill(WHITE)
+                self.draw_game_static(self.static_layer)
+            self.static_key = static_key
+        
+        with section("draw.snapshot"):
+            snapshot = self.get_dynamic_snapshot()
+        if full_redraw:
+            dirty = [self.screen.get_rect()]
+        else:
+            dirty = []
+            for key in snapshot.keys() | self.last_snapshot.keys():
+                old = self.last_snapshot.get(key)
+                new = snapshot.get(key)
+                if old != new:
+                    if old:
+                        dirty.append(old[0])
+                    if new:
+                        dirty.append(new[0])
+        self.last_snapshot = snapshot
+        
+        if not dirty:
+            return []
+        if len(dirty) > 8:
+            dirty = [dirty[0].unionall(dirty[1:])]
+        
+        with section("draw.dynamic"):
+            for rect in dirty:
+                self.screen.set_clip(rect)
+                self.screen.blit(self.static_layer, rect, rect)
+                self.draw_game_dynamic(self.screen)
+                self.draw_overlay(self.screen)
+            self.screen.set_clip(None)
+        return dirty
 
     def draw_multiline_text(self, text, x, y, max_width, font, color=(0,0,0)):
-        words = text.split(' ')
-        lines = []
-        current_line = []
-        
-        for word in words:
-            current_line.append(word)
-            text_surf = font.render(' '.join(current_line), True, color)
-            if text_surf.get_width() > max_width:
-                current_line.pop()
-                lines.append(' '.join(current_line))
-                current_line = [word]
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-            
-        for i, line in enumerate(lines):
-            text_surf = font.render(line, True, color)
-            rect = text_surf.get_rect(center=(x, y + i * 40))
-            self.screen.blit(text_surf, rect)
+        # Wrapped and rendered once, then a single blit per frame
+        surface, first_line_y = render_paragraph(text, font, max_width, color, line_spacing=40)
+        rect = surface.get_rect(midtop=(x, y - first_line_y))
+        self.screen.blit(surface, rect)
 
 def get_level_description(config):
     if config["spawn_mode"] == "raining":
@@ -0,0 +1,186 @@
+import json
+import time
+import functools
+import contextlib
+from collections import deque
+import pygame
+from src.metrics import Histogram
+from src.fonts import get_font
+
+# Returned by section() while profiling is off, so instrumented code costs almost nothing
+_NO_SECTION = contextlib.nullcontext()
+
+class _Section:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, self.start, time.perf_counter() - self.start)
+        return False
+
+class FrameProfiler:
+    """
+    Per-frame timing of named sections
+
+    Keeps a rolling Histogram (milliseconds) per section and the section timings of the
+    last trace_frames frames, which can be exported as JSON or as a Chrome trace
+    (chrome://tracing, Perfetto). Sections may nest.
+    """
+
+    def __init__(self, enabled=False, window=600, trace_frames=600):
+        self.enabled = enabled
+        self.window = window
+        self.histograms = {}
+        self.frame_time = Histogram(window)
+        self.frame_interval = Histogram(window)
+        self.frames = deque(maxlen=trace_frames) # [(frame number, start, duration, [(name, start, duration)])]
+        self.frame_number = 0
+        self.epoch = time.perf_counter()
+        self._frame_start = None
+        self._last_frame_start = None
+        self._sections = []
+        # name -> object with to_dict() and summary(), added to exports and the overlay
+        self.reporters = {}
+
+        self.overlay_visible = False
+        self.overlay_refresh = 0.25 # seconds between overlay redraws
+        self._overlay = None
+        self._overlay_time = 0.0
+
+    def section(self, name):
+        """Context manager timing the enclosed code as name"""
+        if not self.enabled:
+            return _NO_SECTION
+        return _Section(self, name)
+
+    def add(self, name, start, duration):
+        """Record a section measured elsewhere (start from time.perf_counter(), duration in seconds)"""
+        if not self.enabled:
+            return
+        self._sections.append((name, start, duration))
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram(self.window)
+        histogram.add(duration * 1000)
+
+    def instrument(self, obj, method_names, prefix):
+        """Replace obj's methods by wrappers that time each call as '<prefix>.<method>'"""
+        for method_name in method_names:
+            method = getattr(obj, method_name)
+
+            @functools.wraps(method)
+            def timed(*args, _method=method, _name=f"{prefix}.{method_name}", **kwargs):
+                with self.section(_name):
+                    return _method(*args, **kwargs)
+
+            setattr(obj, method_name, timed)
+
+    def begin_frame(self):
+        self._sections = []
+        if not self.enabled:
+            self._frame_start = None
+            return
+        now = time.perf_counter()
+        if self._last_frame_start is not None:
+            self.frame_interval.add((now - self._last_frame_start) * 1000)
+        self._frame_start = self._last_frame_start = now
+
+    def end_frame(self):
+        """Close the frame started by begin_frame(). Call before waiting for the next frame."""
+        if self._frame_start is None:
+            return
+        duration = time.perf_counter() - self._frame_start
+        self.frame_time.add(duration * 1000)
+        self.frames.append((self.frame_number, self._frame_start, duration, self._sections))
+        self.frame_number += 1
+        self._frame_start = None
+
+    def toggle_overlay(self):
+        """Show or hide the overlay. Showing it turns profiling on."""
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible and not self.enabled:
+            self.enabled = True
+            self._last_frame_start = None
+        self._overlay = None
+
+    def fps(self):
+        interval = self.frame_interval.mean()
+        return 1000 / interval if interval else 0.0
+
+    def overlay_surface(self):
+        """The overlay, re-rendered at most every overlay_refresh seconds, or None if hidden"""
+        if not self.overlay_visible:
+            return None
+        now = time.perf_counter()
+        if self._overlay is not None and now - self._overlay_time < self.overlay_refresh:
+            return self._overlay
+
+        lines = [f"FPS {self.fps():5.1f}   frame p50 {self.frame_time.percentile(50):5.2f}"
+                 f"  p99 {self.frame_time.percentile(99):5.2f} ms"]
+        slowest = sorted(self.histograms.items(), key=lambda item: item[1].mean(), reverse=True)
+        for name, histogram in slowest[:6]:
+            lines.append(f"{name:<20} {histogram.mean():6.2f} {histogram.percentile(99):6.2f}")
+        lines.extend(reporter.summary() for reporter in self.reporters.values())
+
+        font = get_font('Consolas', 14, fallback_size=18)
+        line_height = font.get_linesize()
+        width = max(font.size(line)[0] for line in lines) + 12
+        surface = pygame.Surface((width, line_height * len(lines) + 8), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 170))
+        for i, line in enumerate(lines):
+            surface.blit(font.render(line, True, (255, 255, 255)), (6, 4 + i * line_height))
+
+        self._overlay = surface
+        self._overlay_time = now
+        return surface
+
+    def to_dict(self):
+        data = {
+            "frames": self.frame_number,
+            "fps": self.fps(),
+            "frame_time": self.frame_time.to_dict(),
+            "frame_interval": self.frame_interval.to_dict(),
+            "sections": {name: histogram.to_dict() for name, histogram in self.histograms.items()},
+            "trace": [
+                {
+                    "frame": number,
+                    "start": (start - self.epoch) * 1000,
+                    "duration": duration * 1000,
+                    "sections": [{"name": name, "start": (s - self.epoch) * 1000, "duration": d * 1000}
+                                 for name, s, d in sections],
+                }
+                for number, start, duration, sections in self.frames
+            ],
+        }
+        for name, reporter in self.reporters.items():
+            data[name] = reporter.to_dict()
+        return data
+
+    def to_chrome_trace(self):
+        """Trace Event Format: complete ('X') events in microseconds"""
+        events = []
+        for number, start, duration, sections in self.frames:
+            events.append({"name": "frame", "ph": "X", "pid": 0, "tid": 0,
+                           "ts": (start - self.epoch) * 1e6, "dur": duration * 1e6,
+                           "args": {"frame": number}})
+            for name, s, d in sections:
+                events.append({"name": name, "ph": "X", "pid": 0, "tid": 0,
+                               "ts": (s - self.epoch) * 1e6, "dur": d * 1e6})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, json_path, trace_path=None):
+        """Write the histograms and recent frames as JSON, and optionally a Chrome trace"""
+        try:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, indent=2)
+            if trace_path:
+                with open(trace_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.to_chrome_trace(), f)
+            print(f"Frame profile saved to {json_path}" + (f" and {trace_path}" if trace_path else ""))
+        except OSError as e:
+            print(f"Failed to save frame profile: {e}")
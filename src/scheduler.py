@@ -0,0 +1,72 @@
+import pygame
+from src.metrics import Histogram
+
+class FrameScheduler:
+    """
+    Frame pacing that stops rendering while nothing can change
+
+    While the game reports itself quiescent for more than idle_after frames, the loop
+    blocks in pygame.event.wait() (waking at least every idle_timeout ms) instead of
+    ticking at full rate. Any event - input, timers, speech - brings it straight back.
+    """
+
+    def __init__(self, fps, idle_after=2, idle_timeout=250):
+        self.fps = fps
+        self.idle_after = idle_after
+        self.idle_timeout = idle_timeout
+        self.clock = pygame.time.Clock()
+        self.quiet_frames = 0
+        self.idle = False
+        self.idle_waits = 0
+        self.idle_seconds = 0.0
+        # Pacing of consecutive full-rate frames (ms), idle waits are not counted
+        self.interval = Histogram()
+        self.jitter = Histogram() # |interval - 1000 / fps|
+        self._paced = False
+
+    def start(self):
+        self.clock.tick()
+
+    def end_frame(self, quiescent):
+        """
+        Wait until the next frame is due
+
+        Returns:
+            (seconds to simulate, events received while waiting or None). After an idle
+            wait the elapsed time is 0: nothing was moving, and simulating the wait
+            would make the reaction to the waking event jump ahead.
+        """
+        self.quiet_frames = self.quiet_frames + 1 if quiescent else 0
+        if self.quiet_frames > self.idle_after:
+            self.idle = True
+            self._paced = False
+            event = pygame.event.wait(self.idle_timeout)
+            self.idle_waits += 1
+            self.idle_seconds += self.clock.tick() / 1000
+            if event.type == pygame.NOEVENT:
+                return 0.0, None
+            # Back to full rate right away
+            self.quiet_frames = 0
+            return 0.0, [event] + pygame.event.get()
+
+        self.idle = False
+        interval = self.clock.tick(self.fps)
+        if self._paced:
+            self.interval.add(interval)
+            self.jitter.add(abs(interval - 1000 / self.fps))
+        self._paced = True
+        return interval / 1000, None
+
+    def summary(self):
+        """One line for the profiler overlay"""
+        state = "idle" if self.idle else "active"
+        return f"pacing {state}  jitter p50 {self.jitter.percentile(50):4.1f}  p99 {self.jitter.percentile(99):4.1f} ms"
+
+    def to_dict(self):
+        return {
+            "fps": self.fps,
+            "idle_waits": self.idle_waits,
+            "idle_seconds": self.idle_seconds,
+            "interval": self.interval.to_dict(),
+            "jitter": self.jitter.to_dict(),
+        }
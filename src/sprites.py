@@ -1,6 +1,9 @@
 import pygame
 import math
 from src.constants import *
+from src.fonts import get_font
+from src.trajectory import MotionPlanner, angle_delta
+from src.display import draw_line, draw_circle
 
 class RoboticArm:
     def __init__(self, base_x, base_y):
@@ -12,31 +15,47 @@ class RoboticArm:
         self.rest_pos = (base_x + 100, base_y - 100)
         self.target_pos = self.rest_pos
         self.current_pos = self.rest_pos
+        self.prev_pos = self.rest_pos # Position before the last update, for render interpolation
+        self.prev_angles = (self.angle1, self.angle2)
         self.held_wagon = None
         self.state = "idle"  # States: idle, moving_to_pickup, picking, holding, moving_to_slot, placing
-        self.animation_speed = 5  # pixels per frame
+        self.speed = ARM_SPEED  # average pixels per second
+        self.joints = self.get_joint_positions() # (elbow, claw) for the current angles
         
-    def update(self, target_pos=None):
+        # Moves are eased joint-space trajectories, planned once per (start, end)
+        self.planner = MotionPlanner(self, self.speed, rate=SIM_RATE)
+        self.trajectory = None
+        self.trajectory_time = 0.0
+        self.trajectory_target = None
+        
+    def update(self, dt, target_pos=None):
+        """Advance the claw along its trajectory to the target by dt seconds"""
         if target_pos:
             self.target_pos = target_pos
-        
-        # Smoothly interpolate current position to target position
-        dx = self.target_pos[0] - self.current_pos[0]
-        dy = self.target_pos[1] - self.current_pos[1]
-        distance = math.sqrt(dx*dx + dy*dy)
-        
-        if distance > self.animation_speed:
-            # Move towards target
-            ratio = self.animation_speed / distance
-            self.current_pos = (
-                self.current_pos[0] + dx * ratio,
-                self.current_pos[1] + dy * ratio
-            )
-        else:
-            # Reached target
-            self.current_pos = self.target_pos
-        
-        self.solve_ik(self.current_pos[0], self.current_pos[1])
+        self.prev_pos = self.current_pos
+        self.prev_angles = (self.angle1, self.angle2)
+        
+        # A new target starts a new move from wherever the claw is now
+        target = tuple(self.target_pos)
+        if target != self.trajectory_target:
+            self.trajectory_target = target
+            self.trajectory_time = 0.0
+            if self.current_pos != target:
+                self.trajectory = self.planner.plan(self.current_pos, target)
+            else:
+                self.trajectory = None
+                self.solve_ik(target[0], target[1])
+        
+        if self.trajectory is not None:
+            self.trajectory_time += dt
+            self.angle1, self.angle2, claw = self.trajectory.sample(self.trajectory_time)
+            if self.trajectory_time >= self.trajectory.duration:
+                # Reached target
+                self.current_pos = target
+                self.trajectory = None
+            else:
+                self.current_pos = claw
+            self.joints = self.get_joint_positions()
         
         # Update held wagon position if holding one
         if self.held_wagon:
@@ -44,7 +63,14 @@ class RoboticArm:
             self.held_wagon.rect.center = (int(end_pos[0]), int(end_pos[1]))
 
     def solve_ik(self, x, y):
+        self.angle1, self.angle2 = self.compute_angles(x, y)
+        # Forward kinematics once per update, reused for drawing and the held wagon
+        self.joints = self.get_joint_positions()
+
+    def compute_angles(self, x, y):
+        """Shoulder and elbow angles that put the claw at (x, y), without changing the arm"""
         # Inverse Kinematics for 2-segment arm
+        angle1, angle2 = self.angle1, self.angle2
         dx = x - self.base_pos[0]
         dy = y - self.base_pos[1]
         dist = math.sqrt(dx*dx + dy*dy)
@@ -70,7 +96,7 @@ class RoboticArm:
             angle2_internal = math.acos(cos_angle2)
             
             # Angle 2 (relative to first segment)
-            self.angle2 = angle2_internal
+            angle2 = angle2_internal
             
             # Angle 1 (shoulder)
             # angle1 = atan2(dy, dx) - atan2(l2 * sin(angle2), l1 + l2 * cos(angle2))
@@ -81,18 +107,47 @@ class RoboticArm:
             phi = math.atan2(dy, dx)
             psi = math.atan2(self.l2 * math.sin(angle2_internal), self.l1 + self.l2 * math.cos(angle2_internal))
             
-            self.angle1 = phi - psi
+            angle1 = phi - psi
             
         except ValueError:
             pass
+        return angle1, angle2
 
+    def get_render_angles(self, alpha=1.0):
+        """Angles for drawing the arm alpha of the way from its previous to its current pose"""
+        if alpha >= 1.0 or self.prev_pos == self.current_pos:
+            return self.angle1, self.angle2
+        prev1, prev2 = self.prev_angles
+        return (prev1 + angle_delta(prev1, self.angle1) * alpha,
+                prev2 + angle_delta(prev2, self.angle2) * alpha)
+
+    def get_joint_positions(self, angles=None):
+        """Elbow and claw positions for the given (default: current) angles"""
+        angle1, angle2 = angles or (self.angle1, self.angle2)
+        x1 = self.base_pos[0] + self.l1 * math.cos(angle1)
+        y1 = self.base_pos[1] + self.l1 * math.sin(angle1)
+        x2 = x1 + self.l2 * math.cos(angle1 + angle2)
+        y2 = y1 + self.l2 * math.sin(angle1 + angle2)
+        return (x1, y1), (x2, y2)
+    
+    def get_render_joints(self, alpha=1.0):
+        """Elbow and claw positions to draw, interpolated like get_render_angles()"""
+        if alpha >= 1.0 or self.prev_pos == self.current_pos:
+            return self.joints
+        return self.get_joint_positions(self.get_render_angles(alpha))
+    
+    def get_bounds(self, alpha=1.0):
+        """Screen rect covering everything draw() paints"""
+        (x1, y1), (x2, y2) = self.get_render_joints(alpha)
+        xs = (self.base_pos[0], x1, x2)
+        ys = (self.base_pos[1], y1, y2)
+        rect = pygame.Rect(int(min(xs)), int(min(ys)), int(max(xs) - min(xs)) + 1, int(max(ys) - min(ys)) + 1)
+        # Thickest line is 20px and the base joint has a 15px radius
+        return rect.inflate(40, 40)
+    
     def get_end_position(self):
         """Get the position of the arm's end effector (claw)"""
-        x1 = self.base_pos[0] + self.l1 * math.cos(self.angle1)
-        y1 = self.base_pos[1] + self.l1 * math.sin(self.angle1)
-        x2 = x1 + self.l2 * math.cos(self.angle1 + self.angle2)
-        y2 = y1 + self.l2 * math.sin(self.angle1 + self.angle2)
-        return (x2, y2)
+        return self.joints[1]
     
     def pick_wagon(self, wagon):
         """Pick up a wagon"""
@@ -108,49 +163,53 @@ class RoboticArm:
     
     def is_at_target(self):
         """Check if arm has reached target position"""
-        dx = self.target_pos[0] - self.current_pos[0]
-        dy = self.target_pos[1] - self.current_pos[1]
-        distance = math.sqrt(dx*dx + dy*dy)
-        return distance < self.animation_speed
+        # update() puts the claw exactly on the target when the trajectory ends, so the
+        # next move is planned from the waypoint itself and hits the planner's cache
+        return self.trajectory is None and tuple(self.current_pos) == tuple(self.target_pos)
     
     def move_to_rest(self):
         """Move arm back to rest position"""
         self.target_pos = self.rest_pos
         self.state = "idle"
 
-    def draw(self, surface):
-        # Calculate joint positions
-        x1 = self.base_pos[0] + self.l1 * math.cos(self.angle1)
-        y1 = self.base_pos[1] + self.l1 * math.sin(self.angle1)
-        
-        x2 = x1 + self.l2 * math.cos(self.angle1 + self.angle2)
-        y2 = y1 + self.l2 * math.sin(self.angle1 + self.angle2)
+    def draw(self, surface, alpha=1.0):
+        # Joint positions from the last update (or interpolated)
+        (x1, y1), (x2, y2) = self.get_render_joints(alpha)
         
         # Draw segments
-        pygame.draw.line(surface, ARM_COLOR, self.base_pos, (x1, y1), 20)
-        pygame.draw.line(surface, ARM_COLOR, (x1, y1), (x2, y2), 15)
+        draw_line(surface, ARM_COLOR, self.base_pos, (x1, y1), 20)
+        draw_line(surface, ARM_COLOR, (x1, y1), (x2, y2), 15)
         
         # Draw joints
-        pygame.draw.circle(surface, JOINT_COLOR, self.base_pos, 15)
-        pygame.draw.circle(surface, JOINT_COLOR, (int(x1), int(y1)), 12)
+        draw_circle(surface, JOINT_COLOR, self.base_pos, 15)
+        draw_circle(surface, JOINT_COLOR, (int(x1), int(y1)), 12)
         
         # Draw claw - open or closed based on whether holding wagon
         if self.held_wagon:
-            pygame.draw.circle(surface, CLAW_COLOR, (int(x2), int(y2)), 12)
+            draw_circle(surface, CLAW_COLOR, (int(x2), int(y2)), 12)
         else:
-            pygame.draw.circle(surface, CLAW_COLOR, (int(x2), int(y2)), 10)
+            draw_circle(surface, CLAW_COLOR, (int(x2), int(y2)), 10)
 
 class Wagon(pygame.sprite.Sprite):
+    # letter -> tile surface, rendered once per process and shared by all wagons
+    _tile_images = {}
+    # letter -> hover animation frames, scale 1.0 (index 0) to HOVER_SCALE (last)
+    _hover_frames = {}
+    
     def __init__(self, letter, target_x, y, start_x, is_raining=False):
         super().__init__()
         self.letter = letter
         
-        # Generate the main tile image
-        self.base_image = self.generate_tile_image()
-        self.image = self.base_image.copy()
+        # Shared tile image and hover frames - never drawn on
+        self.base_image = self.get_tile_image(letter)
+        self.hover_frames = self.get_hover_frames(letter)
+        self.image = self.base_image
+        self.frame_index = 0
         
         self.rect = self.image.get_rect()
         self.rect.topleft = (start_x, y)
+        self.prev_center = self.rect.center # Center before the last update, for render interpolation
+        self.move_remainder = 0.0 # Sub-pixel part of the distance travelled
         
         self.target_x = target_x
         self.target_y = y 
@@ -165,7 +224,37 @@ class Wagon(pygame.sprite.Sprite):
         self.scale = 1.0
         self.target_scale = 1.0
 
-    def generate_tile_image(self):
+    @classmethod
+    def get_tile_image(cls, letter):
+        """Cached wood-style tile for a letter"""
+        image = cls._tile_images.get(letter)
+        if image is None:
+            image = cls.generate_tile_image(letter)
+            cls._tile_images[letter] = image
+        return image
+    
+    @classmethod
+    def get_hover_frames(cls, letter):
+        """Cached list of the letter's tile smoothscaled from 1.0 up to HOVER_SCALE"""
+        frames = cls._hover_frames.get(letter)
+        if frames is None:
+            base = cls.get_tile_image(letter)
+            frames = [base]
+            for i in range(1, HOVER_SCALE_FRAMES):
+                scale = 1.0 + (HOVER_SCALE - 1.0) * i / (HOVER_SCALE_FRAMES - 1)
+                size = (int(WAGON_WIDTH * scale), int(WAGON_HEIGHT * scale))
+                frames.append(pygame.transform.smoothscale(base, size))
+            cls._hover_frames[letter] = frames
+        return frames
+    
+    @classmethod
+    def preload_tiles(cls, letters):
+        """Render the tiles and hover frames for all letters up front so level setup does no drawing"""
+        for letter in letters:
+            cls.get_hover_frames(letter)
+    
+    @staticmethod
+    def generate_tile_image(letter):
         """Generate a consistent wood-style tile"""
         surf = pygame.Surface((WAGON_WIDTH, WAGON_HEIGHT), pygame.SRCALPHA)
         
@@ -179,52 +268,87 @@ class Wagon(pygame.sprite.Sprite):
         pygame.draw.rect(surf, TILE_BORDER_COLOR, (0, 0, WAGON_WIDTH, WAGON_HEIGHT), 4, border_radius=12)
         
         # Text
-        try:
-            font = pygame.font.SysFont('Comic Sans MS', 48, bold=True)
-        except:
-            font = pygame.font.Font(None, 56)
+        font = get_font('Comic Sans MS', 48, bold=True, fallback_size=56)
         
         # Shadow for text
-        text_shadow = font.render(self.letter, True, (200, 150, 100))
+        text_shadow = font.render(letter, True, (200, 150, 100))
         shadow_rect = text_shadow.get_rect(center=(WAGON_WIDTH//2 + 2, WAGON_HEIGHT//2 + 2))
         surf.blit(text_shadow, shadow_rect)
         
         # Main Text
-        text_surf = font.render(self.letter, True, TEXT_COLOR)
+        text_surf = font.render(letter, True, TEXT_COLOR)
         text_rect = text_surf.get_rect(center=(WAGON_WIDTH//2, WAGON_HEIGHT//2))
         surf.blit(text_surf, text_rect)
         
         return surf
 
-    def update(self, event_list):
+    def get_stop_center(self):
+        """Center of the wagon once it has arrived on the conveyor (or landed)"""
+        # Through a Rect, so float targets are rounded the way rect.topleft rounds them
+        rect = self.rect.copy()
+        rect.topleft = (self.target_x, self.target_y)
+        return rect.center
+    
+    def snap(self):
+        """Don't interpolate from the old position after the wagon was moved by hand"""
+        self.prev_center = self.rect.center
+    
+    def render_rect(self, alpha=1.0):
+        """Where to draw the wagon, alpha of the way from its previous to its current position"""
+        if alpha >= 1.0 or self.prev_center == self.rect.center:
+            return self.rect
+        x = self.prev_center[0] + (self.rect.centerx - self.prev_center[0]) * alpha
+        y = self.prev_center[1] + (self.rect.centery - self.prev_center[1]) * alpha
+        return self.rect.move(round(x) - self.rect.centerx, round(y) - self.rect.centery)
+    
+    def update(self, dt, mouse_pos=None):
+        """
+        Advance the hover animation and the conveyor/falling movement by dt seconds
+        
+        mouse_pos is in game coordinates, pygame.mouse.get_pos() if not given
+        """
+        self.prev_center = self.rect.center
+        
         # 1. Animation: Hover Scale
-        mouse_pos = pygame.mouse.get_pos()
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
         if self.rect.collidepoint(mouse_pos) and not self.being_held and (self.arrived or self.is_raining):
-            self.target_scale = 1.15
+            self.target_scale = HOVER_SCALE
         else:
             self.target_scale = 1.0
             
         # Smooth scale interpolation
-        if abs(self.scale - self.target_scale) > 0.01:
-            self.scale += (self.target_scale - self.scale) * 0.2
+        if self.scale != self.target_scale:
+            if abs(self.scale - self.target_scale) > 0.01:
+                # Closes 20% of the gap every 1/60 s
+                self.scale += (self.target_scale - self.scale) * (1 - 0.8 ** (dt * 60))
+            else:
+                self.scale = self.target_scale
             
-            # Apply scale
-            center = self.rect.center
-            new_size = (int(WAGON_WIDTH * self.scale), int(WAGON_HEIGHT * self.scale))
-            self.image = pygame.transform.scale(self.base_image, new_size)
-            self.rect = self.image.get_rect(center=center)
+            # Pick the nearest precomputed frame
+            steps = HOVER_SCALE_FRAMES - 1
+            index = round((self.scale - 1.0) / (HOVER_SCALE - 1.0) * steps)
+            index = max(0, min(steps, index))
+            if index != self.frame_index:
+                self.frame_index = index
+                center = self.rect.center
+                self.image = self.hover_frames[index]
+                self.rect = self.image.get_rect(center=center)
             
         # 2. Movement Logic
         if not self.arrived and not self.being_held and self.current_slot is None:
+            distance = WAGON_SPEED * dt + self.move_remainder
+            step = int(distance)
+            self.move_remainder = distance - step
             if self.is_raining:
                 if self.rect.y < self.target_y:
-                    self.rect.y += WAGON_SPEED
+                    self.rect.y += step
                 else:
                     self.rect.y = self.target_y
                     self.arrived = True
             else:
                 if self.rect.x < self.target_x:
-                    self.rect.x += WAGON_SPEED
+                    self.rect.x += step
                 else:
                     self.rect.x = self.target_x
                     self.arrived = True
@@ -241,18 +365,21 @@ class Slot(pygame.sprite.Sprite):
         self.highlighted_image = self.base_image.copy()
         pygame.draw.rect(self.highlighted_image, (255, 215, 0), (0, 0, SLOT_WIDTH, SLOT_HEIGHT), 5, border_radius=10)
         
-        self.image = self.base_image.copy()
+        self.image = self.base_image
         self.rect = self.image.get_rect()
         self.rect.topleft = (x, y)
         self.occupied_by = None
         self.is_current = False
     
     def set_current(self, is_current):
+        if is_current == self.is_current:
+            return
         self.is_current = is_current
+        # Both images are prebuilt and never drawn on, no need to copy
         if is_current:
-            self.image = self.highlighted_image.copy()
+            self.image = self.highlighted_image
         else:
-            self.image = self.base_image.copy()
+            self.image = self.base_image
 
 class Button(pygame.sprite.Sprite):
     def __init__(self, text, x, y, width, height, color, action):
@@ -263,9 +390,7 @@ class Button(pygame.sprite.Sprite):
         self.color = color
         self.enabled = True # Default enabled
         
-        self.image = pygame.Surface((width, height), pygame.SRCALPHA)
-        self.rect = self.image.get_rect()
-        self.rect.topleft = (x, y)
+        self.rect = pygame.Rect(x, y, width, height)
         self.text = text
         self.action = action
         self._draw_button()
@@ -280,6 +405,8 @@ class Button(pygame.sprite.Sprite):
 
     def _draw_button(self):
         """Draw button with rounded corners and gradient"""
+        # A new surface each time: a scaled Canvas caches what it has seen of the old one
+        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         # Draw rounded rectangle background
         pygame.draw.rect(self.image, self.color, (0, 0, self.width, self.height), border_radius=15)
         
@@ -292,13 +419,10 @@ class Button(pygame.sprite.Sprite):
         pygame.draw.rect(self.image, darker_color, (0, 0, self.width, self.height), 3, border_radius=15)
         
         # Render text with shadow - adjusted font size based on text length
-        try:
-            if len(self.text) > 10:
-                font = pygame.font.SysFont('Comic Sans MS', 24, bold=True)
-            else:
-                font = pygame.font.SysFont('Comic Sans MS', 28, bold=True)
-        except:
-            font = pygame.font.Font(None, 32)
+        if len(self.text) > 10:
+            font = get_font('Comic Sans MS', 24, bold=True, fallback_size=32)
+        else:
+            font = get_font('Comic Sans MS', 28, bold=True, fallback_size=32)
         
         # Shadow
         shadow_surf = font.render(self.text, True, (0, 0, 0, 128))
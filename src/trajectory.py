@@ -0,0 +1,97 @@
+import math
+from collections import OrderedDict
+
+def ease_in_out(t):
+    """Cubic smoothstep: starts and stops with zero velocity"""
+    return t * t * (3 - 2 * t)
+
+def angle_delta(a, b):
+    """Shortest signed rotation from angle a to angle b"""
+    return (b - a + math.pi) % (2 * math.pi) - math.pi
+
+class Trajectory:
+    """Joint angles and claw positions of one eased move, tabulated every 1/rate seconds"""
+
+    def __init__(self, start, end, angles, claws, duration, rate):
+        self.start = start
+        self.end = end
+        self.angles = angles # [(shoulder, elbow)]
+        self.claws = claws # [(x, y)]
+        self.duration = duration
+        self.rate = rate
+
+    def sample(self, t):
+        """(shoulder angle, elbow angle, claw position) t seconds after the start"""
+        position = max(0.0, t) * self.rate
+        index = int(position)
+        if index >= len(self.angles) - 1:
+            angle1, angle2 = self.angles[-1]
+            return angle1, angle2, self.claws[-1]
+        f = position - index
+        (a1, a2), (b1, b2) = self.angles[index], self.angles[index + 1]
+        (x1, y1), (x2, y2) = self.claws[index], self.claws[index + 1]
+        return (a1 + (b1 - a1) * f, a2 + (b2 - a2) * f, (x1 + (x2 - x1) * f, y1 + (y2 - y1) * f))
+
+class MotionPlanner:
+    """
+    Eased joint-space trajectories for one arm, cached by (start, end)
+
+    Moves between the rest pose, wagon stops and slots repeat all game long, so each
+    one is planned once (keyed by whole pixels) and replayed as a table lookup.
+    """
+
+    def __init__(self, arm, speed, rate=60, max_entries=512):
+        """
+        Args:
+            arm: RoboticArm whose geometry (compute_angles, get_joint_positions) is used
+            speed: Average claw speed in pixels per second, sets the duration of a move
+            rate: Table samples per second
+            max_entries: Trajectories kept, least recently used are dropped first
+        """
+        self.arm = arm
+        self.speed = speed
+        self.rate = rate
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def plan(self, start, end):
+        key = (round(start[0]), round(start[1]), round(end[0]), round(end[1]))
+        trajectory = self._cache.get(key)
+        if trajectory is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return trajectory
+
+        self.misses += 1
+        trajectory = self._build(start, end)
+        self._cache[key] = trajectory
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return trajectory
+
+    def precompute(self, moves):
+        """Plan every (start, end) move ahead of time"""
+        for start, end in moves:
+            self.plan(start, end)
+
+    def _build(self, start, end):
+        start_angles = self.arm.compute_angles(*start)
+        end_angles = self.arm.compute_angles(*end)
+        delta1 = angle_delta(start_angles[0], end_angles[0])
+        delta2 = angle_delta(start_angles[1], end_angles[1])
+
+        duration = math.hypot(end[0] - start[0], end[1] - start[1]) / self.speed
+        steps = max(1, math.ceil(duration * self.rate))
+        angles = []
+        claws = []
+        for step in range(steps + 1):
+            s = ease_in_out(min(1.0, step / (duration * self.rate))) if duration > 0 else 1.0
+            pose = (start_angles[0] + delta1 * s, start_angles[1] + delta2 * s)
+            angles.append(pose)
+            claws.append(self.arm.get_joint_positions(pose)[1])
+        return Trajectory(start, end, angles, claws, duration, self.rate)
+
+    def stats(self):
+        return {"entries": len(self._cache), "hits": self.hits, "misses": self.misses}
@@ -1,131 +1,1018 @@
 import os
+import re
+import json
+import platform
 import pygame
-from gtts import gTTS
 import tempfile
-import hashlib
+import time
+import queue
+import threading
+import itertools
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from src.audio_cache import AudioDiskCache, DiskCacheError
+from src.audio_bundle import AudioBundle, write_bundle
+from src.audio_mixer import AudioMixer
+from src.metrics import Histogram
 
-class TTSManager:
-    """Text-to-Speech Manager for Romanian language using gTTS"""
+try:
+    from gtts import gTTS
+except ImportError:
+    gTTS = None
+
+try:
+    import pyttsx3
+except ImportError:
+    pyttsx3 = None
+
+# Speech priorities - a new request replaces pending requests of lower or equal priority
+PRIORITY_LETTER = 0
+PRIORITY_WORD = 1
+PRIORITY_INSTRUCTION = 2
+PRIORITY_FEEDBACK = 3
+
+# Mixer channel (see src/audio_mixer.py) each priority plays on
+PRIORITY_CHANNELS = {
+    PRIORITY_LETTER: "letters",
+    PRIORITY_WORD: "letters",
+    PRIORITY_INSTRUCTION: "narration",
+    PRIORITY_FEEDBACK: "feedback",
+}
+
+# Texts longer than this are synthesized and played sentence by sentence
+LONG_TEXT_CHARS = 60
+SENTENCE_END = re.compile(r'(?<=[.!?;…])\s+')
+
+def split_sentences(text):
+    """Split long narration at sentence punctuation, short texts stay whole"""
+    text = text.strip()
+    if len(text) <= LONG_TEXT_CHARS:
+        return [text]
+    return [chunk for chunk in SENTENCE_END.split(text) if chunk]
+
+class SpeechRequest:
+    """A queued piece of text waiting to be synthesized and played"""
+    
+    def __init__(self, text, priority, seq):
+        self.text = text
+        self.priority = priority
+        self.seq = seq
+        self.cancelled = False
+        self.finished = False
+        self.callbacks = [] # Called with the request on the main thread when playback ends
+        self.created_at = time.perf_counter()
+        # Long texts are streamed: chunk 0 starts playback, the rest follow as they are ready
+        self.chunks = split_sentences(text)
+        self.next_chunk = 1 # Index of the chunk to queue after the ones already playing
+        self.ready_chunks = {} # index -> audio path of chunks waiting to be queued
+        self.failed_chunks = set() # Indices that could not be synthesized, skipped when streaming
+        # Chunks whose clip was gone by playback time, synthesized again by the worker
+        self.redo_chunks = []
+        self.retried_chunks = set()
+    
+    def is_streaming(self):
+        """True while some chunks are still being synthesized or waiting to be queued"""
+        return self.next_chunk < len(self.chunks)
+    
+    def next_ready(self):
+        """(index, audio path) of the chunk to queue next, or None if it is not synthesized yet"""
+        while self.next_chunk in self.failed_chunks:
+            self.next_chunk += 1
+        if self.next_chunk in self.ready_chunks:
+            return self.next_chunk, self.ready_chunks[self.next_chunk]
+        return None
+    
+    def cancel(self):
+        self.cancelled = True
+
+class TTSMetrics:
+    """Counters and timing histograms for the speech pipeline (times in seconds)"""
+    
+    COUNTERS = ("cache_hits", "cache_misses", "regenerations", "errors")
     
     def __init__(self):
+        self.counters = {name: 0 for name in self.COUNTERS}
+        self.synthesis_time = Histogram()
+        self.load_time = Histogram()
+        self.time_to_audio = Histogram()
+        self.backend_synthesis_time = {}
+        self.phrase_synthesis_time = {} # text -> slowest synthesis
+        # Preload threads and the worker report at the same time
+        self._lock = threading.Lock()
+    
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] += amount
+    
+    def record_synthesis(self, text, backend_name, seconds):
+        with self._lock:
+            self.synthesis_time.add(seconds)
+            self.backend_synthesis_time.setdefault(backend_name, Histogram()).add(seconds)
+            self.phrase_synthesis_time[text] = max(seconds, self.phrase_synthesis_time.get(text, 0.0))
+    
+    def record_load(self, seconds):
+        with self._lock:
+            self.load_time.add(seconds)
+    
+    def record_time_to_audio(self, seconds):
+        with self._lock:
+            self.time_to_audio.add(seconds)
+    
+    def to_dict(self):
+        with self._lock:
+            lookups = self.counters["cache_hits"] + self.counters["cache_misses"]
+            slowest = sorted(self.phrase_synthesis_time.items(), key=lambda item: item[1], reverse=True)
+            return {
+                "machine": platform.node(),
+                "platform": platform.platform(),
+                "counters": dict(self.counters),
+                "cache_hit_rate": self.counters["cache_hits"] / lookups if lookups else 0.0,
+                "synthesis_time": self.synthesis_time.to_dict(),
+                "synthesis_time_by_backend": {name: h.to_dict() for name, h in self.backend_synthesis_time.items()},
+                "load_time": self.load_time.to_dict(),
+                "time_to_audio": self.time_to_audio.to_dict(),
+                "slowest_phrases": [{"text": text, "seconds": seconds} for text, seconds in slowest[:10]],
+            }
+
+class TTSBackend:
+    """Base class for speech synthesis engines that render text to an audio file"""
+    
+    name = "base"
+    extension = "wav"
+    
+    def is_available(self):
+        return False
+    
+    def synthesize(self, text, path):
+        """Write the spoken text to path. Raises on failure."""
+        raise NotImplementedError
+    
+    def cache_params(self):
+        """Settings that change the produced audio - part of the disk cache key"""
+        return {"backend": self.name}
+    
+    def close(self):
+        """Release the engine and any thread it runs on"""
+        pass
+
+class GTTSBackend(TTSBackend):
+    """Google Translate TTS - good Romanian voice, needs network"""
+    
+    name = "gtts"
+    extension = "mp3"
+    
+    def __init__(self, lang='ro'):
+        self.lang = lang
+    
+    def is_available(self):
+        return gTTS is not None
+    
+    def synthesize(self, text, path):
+        tts = gTTS(text=text, lang=self.lang, slow=False)
+        tts.save(path)
+    
+    def cache_params(self):
+        return {"backend": self.name, "lang": self.lang, "slow": False}
+
+class Pyttsx3Backend(TTSBackend):
+    """Local offline engine (SAPI5 / NSSpeechSynthesizer / eSpeak) through pyttsx3"""
+    
+    name = "pyttsx3"
+    extension = "wav"
+    
+    def __init__(self, lang='ro', rate=150):
+        self.lang = lang
+        self.rate = rate
+        # SAPI5 (COM, single-threaded apartment) and NSSpeechSynthesizer engines only work
+        # on the thread that created them, so one long-lived thread owns the engine and
+        # synthesize() - called from preload threads and the TTS worker - sends it jobs
+        self._jobs = queue.Queue()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+    
+    def is_available(self):
+        return pyttsx3 is not None
+    
+    def _create_engine(self):
+        if platform.system() == "Windows":
+            # COM has to be initialized on every thread that uses it
+            try:
+                import comtypes
+                comtypes.CoInitialize()
+            except (ImportError, OSError):
+                pass
+        engine = pyttsx3.init()
+        engine.setProperty('rate', self.rate)
+        # Prefer a Romanian voice if the system has one
+        for voice in engine.getProperty('voices'):
+            languages = [str(l).lower() for l in (getattr(voice, 'languages', None) or [])]
+            if any(self.lang in l for l in languages) or self.lang in str(voice.id).lower():
+                engine.setProperty('voice', voice.id)
+                break
+        return engine
+    
+    def _engine_loop(self):
+        """Run every pyttsx3 call on this thread, one job at a time"""
+        engine = None
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            text, path, future = job
+            try:
+                if engine is None:
+                    engine = self._create_engine()
+                engine.save_to_file(text, path)
+                engine.runAndWait()
+                future.set_result(path)
+            except Exception as e:
+                future.set_exception(e)
+    
+    def synthesize(self, text, path):
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._engine_loop, name="pyttsx3-engine", daemon=True)
+                self._thread.start()
+        future = Future()
+        self._jobs.put((text, path, future))
+        future.result()
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            raise RuntimeError("pyttsx3 produced no audio")
+    
+    def cache_params(self):
+        return {"backend": self.name, "lang": self.lang, "rate": self.rate}
+    
+    def close(self):
+        with self._thread_lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._jobs.put(None)
+            thread.join(timeout=1.0)
+
+BACKENDS = {
+    GTTSBackend.name: GTTSBackend,
+    Pyttsx3Backend.name: Pyttsx3Backend,
+}
+
+class SoundCache:
+    """LRU cache of decoded pygame.mixer.Sound objects, bounded by their sample size in bytes"""
+    
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._sounds = OrderedDict() # key -> (sound, bytes)
+    
+    def __contains__(self, key):
+        return key in self._sounds
+    
+    def __len__(self):
+        return len(self._sounds)
+    
+    @staticmethod
+    def sound_bytes(sound):
+        """Decoded size of a Sound without copying its samples"""
+        init = pygame.mixer.get_init()
+        if not init:
+            return 0
+        frequency, fmt, channels = init
+        return int(sound.get_length() * frequency * channels * (abs(fmt) // 8))
+    
+    def get(self, key):
+        entry = self._sounds.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._sounds.move_to_end(key)
+        return entry[0]
+    
+    def put(self, key, sound):
+        self.discard(key)
+        size = self.sound_bytes(sound)
+        if size > self.max_bytes:
+            return
+        self._sounds[key] = (sound, size)
+        self.size_bytes += size
+        # Evict least recently used sounds until we are back under budget
+        while self.size_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._sounds.popitem(last=False)
+            self.size_bytes -= evicted_size
+    
+    def discard(self, key):
+        entry = self._sounds.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= entry[1]
+    
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._sounds),
+            "bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+class TTSManager:
+    """Text-to-Speech Manager for Romanian language using gTTS or a local engine"""
+    
+    # Auto mode keeps the first backend whose average latency is under this (seconds)
+    MAX_BACKEND_LATENCY = 1.5
+    # How long a failing backend is skipped before it is tried again (seconds)
+    BACKEND_RETRY_DELAY = 60.0
+    
+    def __init__(self, backend="auto", sound_cache_bytes=32 * 1024 * 1024, disk_cache_bytes=100 * 1024 * 1024,
+                 bundle_path=None, metrics_path=None):
+        """
+        Args:
+            backend: "auto" to pick by availability and measured latency,
+                or a name from BACKENDS ("gtts", "pyttsx3") to prefer that engine
+            sound_cache_bytes: Memory budget for decoded sounds kept ready to play
+            disk_cache_bytes: Size limit of the synthesized clips kept in the temp directory
+            bundle_path: Optional prebuilt audio bundle (see src/audio_bundle.py) to play clips from
+            metrics_path: If set, performance metrics are written there as JSON on shutdown
+        """
         self.is_speaking = False
-        self.tts_available = True
+        self.metrics = TTSMetrics()
+        self.metrics_path = metrics_path
+        self.sound_cache = SoundCache(sound_cache_bytes)
         
-        # Create cache directory for audio files
+        # Synthesis backends in order of preference
+        self.backend_mode = backend
+        self.backends = [cls() for cls in BACKENDS.values()]
+        self.backends = [b for b in self.backends if b.is_available()]
+        if backend != "auto":
+            self.backends.sort(key=lambda b: b.name != backend)
+        self.backend_latency = {}
+        self.backend_failed_at = {}
+        self._backend_lock = threading.Lock()
+        self.tts_available = len(self.backends) > 0
+        
+        # Manifest-indexed cache of audio files, validated on startup
         self.cache_dir = os.path.join(tempfile.gettempdir(), "santier_cuvinte_tts")
-        if not os.path.exists(self.cache_dir):
-            os.makedirs(self.cache_dir)
+        self.disk_cache = AudioDiskCache(self.cache_dir, disk_cache_bytes)
             
         # Initialize pygame mixer for audio playback
         pygame.mixer.init()
+        self.mixer = AudioMixer()
+        
+        # Prebuilt bundle of decoded clips, memory mapped
+        self.bundle = None
+        if bundle_path and os.path.exists(bundle_path):
+            try:
+                bundle = AudioBundle(bundle_path)
+                if bundle.matches_mixer():
+                    self.bundle = bundle
+                    print(f"Loaded audio bundle with {len(bundle)} clips")
+                else:
+                    print("Audio bundle was built for a different mixer format, ignoring it")
+                    bundle.close()
+            except Exception as e:
+                print(f"Failed to load audio bundle: {e}")
+        
+        # Background synthesis: speak() queues requests, the worker generates audio
+        # and hands finished clips back through ready_queue for the main thread to play
+        self._seq = itertools.count()
+        self._pending = []
+        self._cond = threading.Condition()
+        self.ready_queue = queue.Queue()
+        # Posted whenever a clip is handed over, so a main loop blocked in pygame.event.wait() wakes up
+        self.ready_event = pygame.event.custom_type()
+        self.playing = {} # channel name -> request playing there
+        self._deferred = {} # channel name -> (request, audio_path) waiting to start
+        self._working = None # request the worker is synthesizing
+        self._idle_callbacks = []
+        self._running = True
+        self._worker = threading.Thread(target=self._worker_loop, name="tts-worker", daemon=True)
+        self._worker.start()
         
-        print("gTTS Romanian TTS Engine initialized successfully")
+        if self.tts_available:
+            names = ", ".join(b.name for b in self.backends)
+            print(f"Romanian TTS initialized successfully (backends: {names})")
+        else:
+            print("No TTS backend available (install gtts or pyttsx3)")
     
-    def _get_cache_path(self, text):
-        """Get cached audio file path for given text"""
-        # Create hash of text for filename
-        text_hash = hashlib.md5(text.encode('utf-8')).hexdigest()
-        return os.path.join(self.cache_dir, f"{text_hash}.mp3")
+    def _cache_params(self, text, backend):
+        """Everything that identifies a clip in the disk cache"""
+        params = backend.cache_params()
+        params["text"] = text
+        return params
+    
+    def _ordered_backends(self):
+        """Backends to try, best first, skipping ones that failed recently"""
+        now = time.monotonic()
+        with self._backend_lock:
+            healthy = [b for b in self.backends
+                       if now - self.backend_failed_at.get(b.name, -self.BACKEND_RETRY_DELAY) >= self.BACKEND_RETRY_DELAY]
+            if not healthy:
+                # Everything failed recently - try them all again rather than stay silent
+                healthy = list(self.backends)
+            if self.backend_mode == "auto":
+                # Keep preference order among fast backends, slow ones go last (fastest first)
+                def rank(backend):
+                    latency = self.backend_latency.get(backend.name, 0.0)
+                    return latency if latency > self.MAX_BACKEND_LATENCY else 0.0
+                healthy.sort(key=rank)
+        return healthy
+    
+    def _record_backend(self, backend, seconds=None):
+        """Update a backend's average latency, or mark it failed when seconds is None"""
+        with self._backend_lock:
+            if seconds is None:
+                self.backend_failed_at[backend.name] = time.monotonic()
+                return
+            self.backend_failed_at.pop(backend.name, None)
+            previous = self.backend_latency.get(backend.name)
+            if previous is None:
+                self.backend_latency[backend.name] = seconds
+            else:
+                self.backend_latency[backend.name] = 0.7 * previous + 0.3 * seconds
     
     def _generate_audio(self, text):
-        """Generate audio file from text using gTTS"""
-        cache_path = self._get_cache_path(text)
+        """Generate audio file from text with the best available backend"""
+        backends = self._ordered_backends()
         
-        # Check if already cached
-        if os.path.exists(cache_path):
-            print(f"Using cached audio for: {text}")
-            return cache_path
+        # Check if already cached by any backend
+        for backend in backends:
+            cache_path = self.disk_cache.lookup(AudioDiskCache.make_key(self._cache_params(text, backend)))
+            if cache_path:
+                print(f"Using cached audio for: {text}")
+                self.metrics.count("cache_hits")
+                return cache_path
         
+        self.metrics.count("cache_misses")
+        for backend in backends:
+            params = self._cache_params(text, backend)
+            try:
+                print(f"Generating audio for: {text} ({backend.name})")
+                start = time.perf_counter()
+                cache_path = self.disk_cache.store(
+                    AudioDiskCache.make_key(params), params,
+                    lambda path: backend.synthesize(text, path), backend.extension)
+                seconds = time.perf_counter() - start
+                self._record_backend(backend, seconds)
+                self.metrics.record_synthesis(text, backend.name, seconds)
+                print(f"Audio saved to: {cache_path}")
+                return cache_path
+            except DiskCacheError as e:
+                # Not the backend's fault, and every other backend would hit the same directory
+                print(f"TTS cache error: {e}")
+                self.metrics.count("errors")
+                return None
+            except Exception as e:
+                print(f"{backend.name} Error: {e}")
+                self._record_backend(backend)
+                self.metrics.count("errors")
+        return None
+    
+    def _worker_loop(self):
+        """Synthesize queued requests, highest priority first"""
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                request = max(self._pending, key=lambda r: (r.priority, -r.seq))
+                self._pending.remove(request)
+                self._working = request
+                # A request sent back by the main thread only needs the chunks it lost
+                indices = request.redo_chunks or range(len(request.chunks))
+                request.redo_chunks = []
+            
+            # Hand over each sentence as soon as it exists so playback can start early
+            for index in indices:
+                chunk = request.chunks[index]
+                if request.cancelled:
+                    break
+                audio_path = None if self._has_sound(chunk) else self._generate_audio(chunk)
+                if not request.cancelled:
+                    self._hand_over(request, index, audio_path)
+            self._working = None
+    
+    def _hand_over(self, request, index, audio_path):
+        """Pass a finished chunk to the main thread"""
+        self.ready_queue.put((request, index, audio_path))
         try:
-            print(f"Generating audio for: {text}")
-            # Generate Romanian speech
-            tts = gTTS(text=text, lang='ro', slow=False)
-            tts.save(cache_path)
-            print(f"Audio saved to: {cache_path}")
-            return cache_path
-        except Exception as e:
-            print(f"gTTS Error: {e}")
+            pygame.event.post(pygame.event.Event(self.ready_event))
+        except pygame.error:
+            # No event queue without a display (e.g. building the audio bundle)
+            pass
+    
+    def _resynthesize(self, request, index):
+        """
+        Send a chunk whose audio is missing back to the worker, once
+        
+        Used on the main thread instead of synthesizing there, which would freeze the frame.
+        """
+        if request.cancelled:
+            return
+        chunk = request.chunks[index]
+        if index in request.retried_chunks:
+            print(f"Failed to generate audio for: {chunk}")
+            self.metrics.count("errors")
+            request.failed_chunks.add(index)
+            return
+        request.retried_chunks.add(index)
+        with self._cond:
+            request.redo_chunks.append(index)
+            if request not in self._pending:
+                self._pending.append(request)
+            self._cond.notify()
+    
+    def _load_sound(self, text, audio_path, synthesize=False):
+        """
+        Decode an audio file into a Sound
+        
+        A corrupt or missing clip is dropped from the disk cache. It is regenerated right
+        away only if synthesize is set, otherwise None is returned.
+        """
+        start = time.perf_counter()
+        try:
+            sound = pygame.mixer.Sound(audio_path)
+            self.metrics.record_load(time.perf_counter() - start)
+            return sound
+        except (pygame.error, OSError) as e:
+            # A missing file (temp dir cleaned, clip evicted from the disk cache) raises
+            # FileNotFoundError rather than pygame.error
+            print(f"Corrupt or missing audio detected: {e}. Regenerating...")
+            self.metrics.count("regenerations")
+            self.disk_cache.invalidate_path(audio_path)
+            if not synthesize:
+                return None
+            # Regenerate
+            audio_path = self._generate_audio(text)
+            if not audio_path:
+                return None
+            start = time.perf_counter()
+            try:
+                sound = pygame.mixer.Sound(audio_path)
+                self.metrics.record_load(time.perf_counter() - start)
+                return sound
+            except:
+                print("Failed to recover audio.")
+                self.metrics.count("errors")
+                return None
+    
+    def _get_sound(self, text, audio_path=None, synthesize=False):
+        """
+        Decoded Sound for text from memory, the bundle or a clip file
+        
+        Only with synthesize set is missing audio generated here; the main loop leaves
+        that to the worker (see _resynthesize) and gets None.
+        """
+        sound = self.sound_cache.get(text)
+        if sound is None and self.bundle and text in self.bundle:
+            start = time.perf_counter()
+            sound = self.bundle.get_sound(text)
+            self.metrics.record_load(time.perf_counter() - start)
+            self.sound_cache.put(text, sound)
+        if sound is None:
+            if audio_path is None:
+                if not synthesize:
+                    return None
+                audio_path = self._generate_audio(text)
+                if audio_path is None:
+                    return None
+            sound = self._load_sound(text, audio_path, synthesize)
+            if sound is None:
+                return None
+            self.sound_cache.put(text, sound)
+        return sound
+    
+    def _play(self, sound, channel="letters"):
+        """Start playing a decoded sound on a mixer channel. Must run on the main thread."""
+        # A new utterance cuts off the previous one on the same channel
+        if not self.mixer.play(channel, sound):
+            return False
+        self.is_speaking = True
+        return True
+    
+    def _has_sound(self, text):
+        """True if text can be played without synthesis or reading a clip file"""
+        return text in self.sound_cache or (self.bundle is not None and text in self.bundle)
+    
+    def _is_busy(self, channel=None):
+        return self.mixer.is_busy(channel)
+    
+    @staticmethod
+    def _channel_for(request):
+        return PRIORITY_CHANNELS.get(request.priority, "letters")
+    
+    @property
+    def current_request(self):
+        """Most important request that is playing right now"""
+        if not self.playing:
             return None
+        return max(self.playing.values(), key=lambda r: r.priority)
+    
+    def _wait_for_channel(self, channel):
+        """Sleep until the channel's end event arrives, keeping other events for the game"""
+        end_event = self.mixer.channels[channel].end_event
+        other_events = []
+        while self._is_busy(channel):
+            # Timeout in case the end event was already consumed elsewhere
+            event = pygame.event.wait(250)
+            if event.type not in (end_event, pygame.NOEVENT):
+                other_events.append(event)
+        for event in other_events:
+            pygame.event.post(event)
     
-    def speak(self, text, wait=False):
+    def speak(self, text, wait=False, priority=PRIORITY_WORD, on_done=None):
         """
         Speak the given text
         
         Args:
             text: Text to speak
-            wait: If True, block until speech is complete. If False, speak in background.
+            wait: If True, synthesize and block until speech is complete.
+                If False, queue the text for the background worker and return immediately.
+            priority: Queued requests with lower or equal priority are replaced by this one
+            on_done: Optional callback(request) run on the main thread when playback finishes
+        
+        Returns:
+            The queued SpeechRequest (can be cancelled), or None when wait=True
         """
         if not self.tts_available:
             print(f"TTS not available. Would speak: {text}")
-            return
+            return None
+        
+        if wait:
+            self.cancel_all()
+            channel = PRIORITY_CHANNELS.get(priority, "letters")
+            try:
+                for chunk in split_sentences(text):
+                    # The caller asked to block, so synthesizing here is fine
+                    sound = self._get_sound(chunk, synthesize=True)
+                    if sound is None or not self._play(sound, channel):
+                        print(f"Failed to play audio for: {chunk}")
+                        continue
+                    self._wait_for_channel(channel)
+                print("Speech completed")
+                if on_done:
+                    on_done(None)
+            except Exception as e:
+                print(f"TTS Playback Error: {e}")
+                self.metrics.count("errors")
+            self.is_speaking = False
+            return None
+        
+        with self._cond:
+            # Coalesce with an identical pending request
+            for request in self._pending:
+                if request.text == text and not request.cancelled:
+                    request.priority = max(request.priority, priority)
+                    if on_done:
+                        request.callbacks.append(on_done)
+                    return request
             
-        try:
-            # Generate or get cached audio
-            audio_path = self._generate_audio(text)
+            # Stale requests of lower or equal priority are replaced
+            for request in self._pending:
+                if request.priority <= priority:
+                    request.cancel()
+            self._pending = [r for r in self._pending if not r.cancelled]
+            for waiting, _ in self._deferred.values():
+                if waiting.priority <= priority:
+                    waiting.cancel()
+            # The worker stops synthesizing the rest of a stale streamed text
+            if self._working is not None and self._working.priority <= priority:
+                self._working.cancel()
             
-            if audio_path and os.path.exists(audio_path):
-                # Play audio using pygame mixer
-                self.is_speaking = True
-                try:
-                    pygame.mixer.music.load(audio_path)
-                except pygame.error as e:
-                    print(f"Corrupt audio detected: {e}. Regenerating...")
-                    try:
-                        os.remove(audio_path)
-                    except:
-                        pass
-                    # Regenerate
-                    audio_path = self._generate_audio(text)
-                    if audio_path:
-                        try:
-                            pygame.mixer.music.load(audio_path)
-                        except:
-                             print("Failed to recover audio.")
-                             self.is_speaking = False
-                             return
-
-                pygame.mixer.music.play()
-                
-                if wait:
-                    # Wait for playback to complete
-                    while pygame.mixer.music.get_busy():
-                        pygame.time.Clock().tick(10)
-                    self.is_speaking = False
-                    print("Speech completed")
+            request = SpeechRequest(text, priority, next(self._seq))
+            if on_done:
+                request.callbacks.append(on_done)
+            if all(self._has_sound(chunk) for chunk in request.chunks):
+                # Already decoded in memory - no synthesis or file needed
+                for index in range(len(request.chunks)):
+                    self._hand_over(request, index, None)
             else:
-                print(f"Failed to generate audio for: {text}")
-                self.is_speaking = False
-                
+                self._pending.append(request)
+                self._cond.notify()
+        return request
+    
+    def handle_event(self, event):
+        """
+        Track playback completion from the mixer's channel end events
+        
+        Returns:
+            True if the event was a speech end event (the game can ignore it)
+        """
+        if event.type == self.ready_event:
+            # The clip itself is picked up by update()
+            return True
+        channel = self.mixer.channel_for_event(event)
+        if channel is None:
+            return False
+        
+        request = self.playing.get(channel)
+        # A queued sentence keeps the channel busy; an idle channel with sentences still
+        # being synthesized is restarted by _stream_chunks when the next one arrives
+        if request is not None and not self._is_busy(channel):
+            if request.cancelled or not request.is_streaming():
+                del self.playing[channel]
+                self._finish(request)
+        
+        self.mixer.update()
+        self.is_speaking = len(self.playing) > 0
+        return True
+    
+    def _finish(self, request):
+        request.finished = True
+        if request.cancelled:
+            return
+        for callback in request.callbacks:
+            try:
+                callback(request)
+            except Exception as e:
+                print(f"Speech callback error: {e}")
+    
+    def is_idle(self):
+        """True when nothing is playing, waiting or being synthesized"""
+        return (not self.playing and not self._deferred and not self._pending
+                and self._working is None and self.ready_queue.empty())
+    
+    def needs_update(self):
+        """
+        True while update() has work that no event will announce
+        
+        Finished clips and the end of playback post events; clips waiting for a
+        channel, sentences to queue and idle callbacks need update() to be polled.
+        """
+        if not self.ready_queue.empty() or self._deferred:
+            return True
+        if any(request.next_ready() for request in self.playing.values()):
+            return True
+        return bool(self._idle_callbacks) and self.is_idle()
+    
+    def when_idle(self, callback):
+        """Run callback() on the main thread once all queued speech has finished"""
+        self._idle_callbacks.append(callback)
+    
+    def update(self):
+        """Start playback of synthesized requests. Call once per frame from the main thread."""
+        while True:
+            try:
+                request, index, audio_path = self.ready_queue.get_nowait()
+            except queue.Empty:
+                break
+            if request.cancelled:
+                continue
+            chunk = request.chunks[index]
+            if audio_path is None and not self._has_sound(chunk):
+                # Synthesis failed, or the sound was evicted from memory since the worker checked
+                self._resynthesize(request, index)
+                continue
+            if index > 0:
+                request.ready_chunks[index] = audio_path
+                continue
+            # Keep the newest request that is allowed to play on its channel
+            channel = self._channel_for(request)
+            waiting = self._deferred.get(channel)
+            if waiting is None or request.priority >= waiting[0].priority:
+                self._deferred[channel] = (request, audio_path)
+        
+        for channel in list(self._deferred):
+            self._start_deferred(channel)
+        for channel in list(self.playing):
+            self._stream_chunks(channel)
+        
+        self.is_speaking = len(self.playing) > 0
+        
+        if self._idle_callbacks and self.is_idle():
+            callbacks, self._idle_callbacks = self._idle_callbacks, []
+            for callback in callbacks:
+                callback()
+    
+    def _start_deferred(self, channel):
+        """Start the first chunk of the request waiting for a channel unless it would cut off a more important one"""
+        request, audio_path = self._deferred[channel]
+        if request.cancelled:
+            del self._deferred[channel]
+            return
+        # A lower priority clip waits for the current one instead of cutting it off
+        current = self.playing.get(channel)
+        if current and self._is_busy(channel) and request.priority < current.priority:
+            return
+        if not self.mixer.can_play(channel):
+            return
+        
+        del self._deferred[channel]
+        try:
+            sound = self._get_sound(request.chunks[0], audio_path)
+            if sound is None:
+                self._resynthesize(request, 0)
+            elif self._play(sound, channel):
+                previous = self.playing.get(channel)
+                if previous is not None and previous is not request:
+                    # Cut off: its end event now finds the new request on the channel
+                    self._finish(previous)
+                    previous.cancel()
+                self.playing[channel] = request
+                self.metrics.record_time_to_audio(time.perf_counter() - request.created_at)
         except Exception as e:
             print(f"TTS Playback Error: {e}")
-            self.is_speaking = False
+            self.metrics.count("errors")
+    
+    def _stream_chunks(self, channel):
+        """Queue the next ready sentence of the request playing on channel for gapless playback"""
+        request = self.playing[channel]
+        if request.cancelled:
+            # The sentence already playing ends on its own, handle_event() cleans up
+            return
+        ready = request.next_ready()
+        if ready is None:
+            if not request.is_streaming() and not self._is_busy(channel):
+                # The last chunks failed after the channel's end event was handled
+                del self.playing[channel]
+                self._finish(request)
+            return
+        index, audio_path = ready
+        busy = self._is_busy(channel)
+        if not (self.mixer.can_queue(channel) if busy else self.mixer.can_play(channel)):
+            return
+        try:
+            sound = self._get_sound(request.chunks[index], audio_path)
+            del request.ready_chunks[index]
+            if sound is None:
+                self._resynthesize(request, index)
+                return
+            request.next_chunk += 1
+            if busy:
+                self.mixer.queue(channel, sound)
+            else:
+                # Synthesis fell behind playback - continue as soon as the chunk exists
+                self._play(sound, channel)
+        except Exception as e:
+            print(f"TTS Playback Error: {e}")
+            self.metrics.count("errors")
+    
+    def cancel(self, request):
+        """Cancel a queued request, stopping it if it is already playing"""
+        if request is None:
+            return
+        request.cancel()
+        for channel, playing in list(self.playing.items()):
+            if playing is request:
+                self.mixer.stop(channel)
+                del self.playing[channel]
+        self.is_speaking = len(self.playing) > 0
+    
+    def cancel_all(self):
+        """Drop every request that has not started playing yet"""
+        with self._cond:
+            for request in self._pending:
+                request.cancel()
+            self._pending = []
+        for request, _ in self._deferred.values():
+            request.cancel()
+        self._deferred = {}
     
     def stop(self):
         """Stop current speech"""
         try:
-            self.engine.stop()
-            self.is_speaking = False
+            self.mixer.stop()
         except:
             pass
+        self.playing = {}
+        self.is_speaking = False
+    
+    def shutdown(self):
+        """Stop the background worker"""
+        self.cancel_all()
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._worker.join(timeout=1.0)
+        for backend in self.backends:
+            backend.close()
+        self.disk_cache.save()
+        if self.metrics_path:
+            self.dump_metrics(self.metrics_path)
+        if self.bundle:
+            self.bundle.close()
+            self.bundle = None
+    
+    def get_metrics(self):
+        """Snapshot of all speech metrics as a JSON-ready dict"""
+        report = self.metrics.to_dict()
+        report["sound_cache"] = self.sound_cache.stats()
+        report["disk_cache"] = {"entries": len(self.disk_cache.entries), "bytes": self.disk_cache.size_bytes}
+        report["backend_latency"] = dict(self.backend_latency)
+        return report
+    
+    def dump_metrics(self, path):
+        """Write get_metrics() to path as JSON"""
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.get_metrics(), f, ensure_ascii=False, indent=2)
+            print(f"TTS metrics written to {path}")
+        except OSError as e:
+            print(f"Failed to write TTS metrics: {e}")
     
-    def speak_letter(self, letter):
+    def speak_letter(self, letter, on_done=None):
         """Speak a single letter"""
-        self.speak(letter)
+        return self.speak(letter, priority=PRIORITY_LETTER, on_done=on_done)
     
-    def speak_word(self, word):
+    def speak_word(self, word, on_done=None):
         """Speak a complete word"""
-        self.speak(word)
+        return self.speak(word, priority=PRIORITY_WORD, on_done=on_done)
     
-    def speak_instruction(self, instruction):
+    def speak_instruction(self, instruction, on_done=None):
         """Speak an instruction"""
-        self.speak(instruction)
+        return self.speak(instruction, priority=PRIORITY_INSTRUCTION, on_done=on_done)
 
-    def preload(self, text_list):
-        """Pre-generate audio for a list of texts"""
+    def speak_feedback(self, message, on_done=None):
+        """Speak a feedback message, replacing any stale announcement"""
+        return self.speak(message, priority=PRIORITY_FEEDBACK, on_done=on_done)
+
+    def _timed_generate(self, text):
+        """Generate audio for text and return (path, seconds taken)"""
+        start = time.perf_counter()
+        path = self._generate_audio(text)
+        return path, time.perf_counter() - start
+
+    def preload(self, text_list, max_workers=8, progress_callback=None):
+        """
+        Pre-generate audio for a list of texts
+        
+        Args:
+            text_list: Texts to generate
+            max_workers: Max number of clips generated at the same time (1 = one by one)
+            progress_callback: Optional function called as callback(done, total, text, ok)
+                after each clip finishes
+        
+        Returns:
+            Report dict with 'total', 'failed' (list of texts), 'timings' (text -> seconds)
+            and 'elapsed' (wall clock seconds for the whole preload)
+        """
+        # Long narration is cached sentence by sentence, the way it is played
+        text_list = list(dict.fromkeys(chunk for text in text_list for chunk in split_sentences(text)))
+        if self.bundle:
+            text_list = [text for text in text_list if text not in self.bundle]
         total = len(text_list)
-        print(f"Preloading {total} audio clips...")
-        for i, text in enumerate(text_list):
-            self._generate_audio(text)
-            if (i + 1) % 5 == 0:
-                print(f"Loaded {i + 1}/{total}...")
-        print("Audio preloading complete.")
+        report = {"total": total, "failed": [], "timings": {}, "elapsed": 0.0}
+        if total == 0:
+            return report
+        
+        workers = max(1, min(max_workers, total))
+        print(f"Preloading {total} audio clips ({workers} workers)...")
+        start = time.perf_counter()
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self._timed_generate, text): text for text in text_list}
+            for done, future in enumerate(as_completed(futures), 1):
+                text = futures[future]
+                try:
+                    path, seconds = future.result()
+                except Exception as e:
+                    print(f"Preload Error for '{text}': {e}")
+                    path, seconds = None, 0.0
+                
+                report["timings"][text] = seconds
+                if path is None:
+                    report["failed"].append(text)
+                
+                if progress_callback:
+                    progress_callback(done, total, text, path is not None)
+                if done % 5 == 0:
+                    print(f"Loaded {done}/{total}...")
+        
+        report["elapsed"] = time.perf_counter() - start
+        # store() leaves the manifest to its callers: once per preload instead of once per clip
+        self.disk_cache.save()
+        
+        slowest = max(report["timings"].values())
+        print(f"Audio preloading complete in {report['elapsed']:.2f}s (slowest clip {slowest:.2f}s).")
+        if report["failed"]:
+            print(f"Failed to preload {len(report['failed'])} clips: {report['failed']}")
+        return report
+    
+    def build_bundle(self, text_list, bundle_path, max_workers=8):
+        """
+        Synthesize every text and pack the decoded samples into one bundle file
+        
+        Returns:
+            List of texts that could not be bundled
+        """
+        text_list = list(dict.fromkeys(chunk for text in text_list for chunk in split_sentences(text)))
+        report = self.preload(text_list, max_workers=max_workers)
+        clips = {}
+        failed = list(report["failed"])
+        for text in text_list:
+            if text in failed:
+                continue
+            audio_path = self._generate_audio(text)
+            sound = self._load_sound(text, audio_path, synthesize=True) if audio_path else None
+            if sound is None:
+                failed.append(text)
+                continue
+            clips[text] = sound.get_raw()
+        
+        write_bundle(bundle_path, clips, pygame.mixer.get_init())
+        size = sum(len(raw) for raw in clips.values())
+        print(f"Audio bundle written to {bundle_path}: {len(clips)} clips, {size / (1024 * 1024):.1f} MB")
+        if failed:
+            print(f"Not bundled: {failed}")
+        return failed